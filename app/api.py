@@ -1,53 +1,241 @@
-from fastapi import FastAPI, Query, HTTPException, BackgroundTasks
-from typing import List, Optional
-from .models import Event, ProviderConfig, ProviderListResponse
-from .core import ServiceOrchestrator, ConfigLoader, ProviderLoader
+import os
+import sys
+from fastapi import FastAPI, Query, HTTPException, BackgroundTasks, Request, Response
+from datetime import date, datetime, time, timedelta
+from typing import Any, List, Optional, Tuple
+from .models import JSON_ADAPTER, Event, EventChanges, NearbyEvent, ProviderConfig, ProviderListResponse
+from .core import ServiceOrchestrator, ConfigLoader, ConfigSnapshot, ProviderLoader
 from .storage import EventStorage
+from .snapshot_store import SnapshotStore
+from .follower import StoreFollower
+from .leader import LeaderElection
+from . import compression, metrics
 
 app = FastAPI(title="Salon der Gedanken Event Service")
 
 # Dependency Injection setup
 # In a larger app, we'd use a dependency injection framework or `Depends` more extensively.
 # For simplicity, we initialize singletons here.
-storage = EventStorage()
+storage = EventStorage(SnapshotStore())
 config_loader = ConfigLoader()
 provider_loader = ProviderLoader()
 orchestrator = ServiceOrchestrator(config_loader, provider_loader, storage)
+follower = StoreFollower(storage)
+
+def _become_leader():
+    # Continue from the latest published events, so generations stay consecutive
+    follower.shutdown()
+    try:
+        storage.sync_from_store()
+        orchestrator.start()
+    except Exception:
+        # Stepping down (see LeaderElection): keep serving what the new leader publishes
+        orchestrator.shutdown()
+        follower.start()
+        raise
+
+# Of all processes sharing the event store, only the leader runs the scraper; the others
+# serve what it publishes. SCRAPER_ENABLED=false: never become leader (read-only worker).
+election = LeaderElection(on_elected=_become_leader)
+SCRAPER_ENABLED = os.getenv("SCRAPER_ENABLED", "true").strip().lower() not in ("0", "false", "no")
 
 @app.on_event("startup")
 def startup_event():
-    orchestrator.start()
+    # Serve the last persisted events right away; the providers are updated in the background
+    storage.restore(orchestrator.get_enabled_provider_ids())
+    # Follow the store until elected (which may be right away)
+    follower.start()
+    if SCRAPER_ENABLED:
+        election.start()
+
+@app.on_event("shutdown")
+def shutdown_event():
+    follower.shutdown()
+    orchestrator.shutdown()
+    election.shutdown()
+
+def _date_range(on: Optional[date], from_date: Optional[date], to_date: Optional[date]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """
+    Converts the date filters into a [start, end) range of start dates.
+    "date" selects a single day, "from"/"to" are inclusive and may be used alone.
+    """
+    if on is not None:
+        if from_date is not None or to_date is not None:
+            raise HTTPException(status_code=400, detail="Use either 'date' or 'from'/'to', not both.")
+        from_date = to_date = on
+    if from_date is not None and to_date is not None and from_date > to_date:
+        raise HTTPException(status_code=400, detail="'from' must not be after 'to'.")
+
+    start = datetime.combine(from_date, time.min) if from_date is not None else None
+    end = datetime.combine(to_date + timedelta(days=1), time.min) if to_date is not None else None
+    return start, end
+
+def _etag(*parts) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+def _is_not_modified(request: Request, etag: str) -> bool:
+    """
+    True if the client's If-None-Match lists the current ETag.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, proxies may have marked our tags as weak
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+# Clients may keep responses but have to revalidate them (cheap thanks to the ETags)
+CACHE_CONTROL = "no-cache"
+
+def _json_response(content: Any, headers: Optional[dict] = None) -> Response:
+    """
+    Serializes stored events (EventRecord.to_dict) directly. Returning a Response skips
+    FastAPI's response_model validation, which would only check the stored events again;
+    response_model still documents the schema.
+    """
+    return Response(content=JSON_ADAPTER.dump_json(content), media_type="application/json", headers=headers)
 
 @app.get("/events", response_model=List[Event])
 def get_events(
-    provider_id: Optional[str] = None
+    request: Request,
+    provider_id: Optional[str] = None,
+    on: Optional[date] = Query(None, alias="date", description="Events starting on this day (YYYY-MM-DD)"),
+    from_date: Optional[date] = Query(None, alias="from", description="Events starting on or after this day"),
+    to_date: Optional[date] = Query(None, alias="to", description="Events starting on or before this day"),
+):
+    start, end = _date_range(on, from_date, to_date)
+    provider_id = provider_id or None
+    if start is None and end is None:
+        # A client that has the current list gets its 304 before anything is serialized.
+        # The encoding depends on the body size, but the body of a generation never
+        # changes, so only the encodings possible for this Accept-Encoding are compared.
+        accept_encoding = request.headers.get("accept-encoding")
+        generation = storage.get_generation(provider_id)
+        for encoding in (compression.negotiate(accept_encoding, sys.maxsize), compression.IDENTITY):
+            etag = _etag(storage.epoch, generation, encoding)
+            if _is_not_modified(request, etag):
+                return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Accept-Encoding"})
+
+        # Unfiltered lists are served from the pre-serialized (and pre-compressed) bodies
+        serialized = storage.get_serialized_events(provider_id)
+        encoding = compression.negotiate(accept_encoding, serialized.size)
+        headers = {
+            "ETag": _etag(storage.epoch, serialized.generation, encoding),
+            "Cache-Control": CACHE_CONTROL,
+            "Vary": "Accept-Encoding",
+        }
+        if encoding != compression.IDENTITY:
+            headers["Content-Encoding"] = encoding
+        return Response(content=serialized.encoded(encoding), media_type="application/json", headers=headers)
+
+    # Date filters select a slice of the provider's (or all) events, which only changes with them.
+    # Tag and events come from the same snapshot, so they always match.
+    snapshot = storage.snapshot
+    etag = _etag(storage.epoch, snapshot.get_generation(provider_id), compression.IDENTITY)
+    if _is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+    events = [event.to_dict() for event in snapshot.get_events(provider_id, start, end)]
+    return _json_response(events, {"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+def _sync_token(generation: int) -> str:
+    return f"{storage.epoch}.{generation}"
+
+def _parse_sync_token(token: Optional[str]) -> Optional[int]:
+    """
+    Returns the generation of a token issued by this server run, None otherwise.
+    """
+    epoch, _, generation = (token or "").partition(".")
+    if epoch != storage.epoch or not generation.isdigit():
+        return None
+    return int(generation)
+
+@app.get("/events/changes", response_model=EventChanges)
+def get_event_changes(since: Optional[str] = Query(None, description="Token of the last sync, omit for the first one")):
+    snapshot = storage.snapshot
+    generation = _parse_sync_token(since)
+    changes = snapshot.get_changes(generation) if generation is not None else None
+    if changes is None or not changes.complete:
+        # The client has to reload everything; the token is taken before it does, so
+        # changes saved while it loads /events are delivered again with the next sync
+        return EventChanges(token=_sync_token(snapshot.generation), resync=True, changed=[], removed=[])
+    return _json_response({
+        "token": _sync_token(changes.generation),
+        "resync": False,
+        "changed": [event.to_dict() for event in changes.changed],
+        "removed": changes.removed,
+    })
+
+@app.get("/events/nearby", response_model=List[NearbyEvent])
+def get_nearby_events(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius_km: float = Query(5.0, gt=0, le=500),
+    provider_id: Optional[str] = None,
+    on: Optional[date] = Query(None, alias="date", description="Events starting on this day (YYYY-MM-DD)"),
+    from_date: Optional[date] = Query(None, alias="from", description="Events starting on or after this day"),
+    to_date: Optional[date] = Query(None, alias="to", description="Events starting on or before this day"),
+):
+    start, end = _date_range(on, from_date, to_date)
+    return _json_response([
+        {**event.to_dict(), "distance_km": round(distance, 3)}
+        for event, distance in storage.get_nearby_events(lat, lon, radius_km, provider_id or None, start, end)
+    ])
+
+@app.get("/events/search", response_model=List[Event])
+def search_events(
+    q: str = Query(..., min_length=1, description="Search words, matched as prefixes against titles and descriptions"),
+    provider_id: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
 ):
-    if provider_id:
-        events = storage.get_events_by_provider(provider_id)
-    else:
-        events = storage.get_all_events()
-    return events
+    return _json_response([event.to_dict() for event in storage.search_events(q, provider_id or None, limit)])
+
+# Serialized /providers body, rebuilt only when the config revision changes
+_providers_body: Tuple[Optional[str], bytes] = (None, b"")
+
+def _build_providers_body(snapshot: ConfigSnapshot) -> bytes:
+    version = str(snapshot.raw.get("version", "unknown"))
+
+    # Filter only enabled providers and mask module path for security and client relevance
+    enabled_configs = [c.model_copy(update={"module": "***"}) for c in snapshot.providers if c.enabled]
+
+    return ProviderListResponse(version=version, providers=enabled_configs).model_dump_json().encode()
 
 @app.get("/providers", response_model=ProviderListResponse)
-def get_providers():
-    raw_config = config_loader.load_config()
-    version = str(raw_config.get("version", "unknown"))
-    
-    configs = config_loader.get_providers_config()
-    # Filter only enabled providers
-    enabled_configs = [c for c in configs if c.enabled]
-    
-    # Mask module path for security and client relevance
-    for config in enabled_configs:
-        config.module = "***"
-        
-    return ProviderListResponse(version=version, providers=enabled_configs)
+def get_providers(request: Request):
+    global _providers_body
+    snapshot = config_loader.get_snapshot()
+    # The config revision is a hash of the config file, so it is stable across restarts
+    headers = {"ETag": _etag("providers", snapshot.revision), "Cache-Control": CACHE_CONTROL}
+    if _is_not_modified(request, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    revision, body = _providers_body
+    if revision != snapshot.revision:
+        body = _build_providers_body(snapshot)
+        _providers_body = (snapshot.revision, body)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @app.get("/status")
 def get_status():
-    return {"status": "running", "providers_loaded": len(config_loader.get_providers_config())}
+    return {
+        "status": "running",
+        "role": "leader" if election.is_leader else "follower",
+        "providers_loaded": len(config_loader.get_snapshot().providers),
+        "schedule": orchestrator.provider_scheduler.get_status(),
+        "provider_modules": provider_loader.get_stats(),
+        "http_cache": orchestrator.get_fetch_stats(),
+    }
+
+@app.get("/metrics")
+def get_metrics():
+    # Prometheus text format; values are only formatted when scraped
+    return Response(content=metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
 
 @app.post("/refresh", status_code=202)
 def refresh_events(background_tasks: BackgroundTasks):
-    background_tasks.add_task(orchestrator.force_reload)
+    if election.is_leader:
+        background_tasks.add_task(orchestrator.force_reload)
+    elif not storage.request_refresh():
+        raise HTTPException(status_code=503, detail="No scraper available.")
     return {"status": "reload_initiated"}
@@ -0,0 +1,61 @@
+import json
+import logging
+import os
+import time
+from threading import Lock
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 32
+
+
+class AssetCache:
+    """
+    Persistent cache for data extracted from immutable, content-hashed assets
+    (e.g. "/assets/index-Db8MTPiW.js"). The URL changes whenever the content does,
+    so entries never need revalidation; old ones are only dropped once the cache
+    holds more than `max_entries` assets.
+
+    Values must be JSON serializable. Keys should include a version of the
+    extraction logic, so changed extraction code does not reuse stale results.
+    """
+
+    def __init__(self, cache_file: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_file = cache_file or os.getenv("ASSET_CACHE_FILE", "asset_cache.json")
+        self.max_entries = max_entries
+        self.lock = Lock()
+        self.cache = self._load_cache()
+
+    def _load_cache(self) -> dict:
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, "r") as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                logger.error("Failed to load asset cache, starting empty.")
+                return {}
+        return {}
+
+    def _save_cache(self):
+        tmp_file = f"{self.cache_file}.tmp"
+        try:
+            with open(tmp_file, "w") as f:
+                json.dump(self.cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.error(f"Failed to save asset cache: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            entry = self.cache.get(key)
+            return entry["value"] if entry is not None else None
+
+    def put(self, key: str, value: Any):
+        with self.lock:
+            self.cache[key] = {"stored_at": time.time(), "value": value}
+            if len(self.cache) > self.max_entries:
+                oldest = sorted(self.cache, key=lambda k: self.cache[k]["stored_at"])
+                for old_key in oldest[:len(self.cache) - self.max_entries]:
+                    del self.cache[old_key]
+            self._save_cache()
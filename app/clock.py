@@ -0,0 +1,38 @@
+import os
+from datetime import date, datetime
+from typing import Optional
+
+# Set by pin(), so parse worker processes started afterwards see the same time
+PIN_ENV = "CLOCK_PIN"
+
+
+def _from_env() -> Optional[datetime]:
+    value = os.getenv(PIN_ENV)
+    return datetime.fromisoformat(value) if value else None
+
+
+_pinned: Optional[datetime] = _from_env()
+
+
+def now() -> datetime:
+    """
+    Current local time as seen by providers (e.g. to infer the year of "12. Feb").
+    Returns the pinned time while replaying a recorded cycle.
+    """
+    return _pinned if _pinned is not None else datetime.now()
+
+
+def today() -> date:
+    return now().date()
+
+
+def pin(moment: datetime):
+    global _pinned
+    _pinned = moment
+    os.environ[PIN_ENV] = moment.isoformat()
+
+
+def unpin():
+    global _pinned
+    _pinned = None
+    os.environ.pop(PIN_ENV, None)
@@ -0,0 +1,60 @@
+"""
+Content-Encoding helpers for response bodies that are compressed once and served many times.
+"""
+import gzip
+from typing import Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+IDENTITY = "identity"
+GZIP = "gzip"
+BROTLI = "br"
+
+# Bodies are compressed once per data change, so a high compression level is affordable
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+# Below this size the encoding overhead outweighs the savings
+MIN_COMPRESS_BYTES = 512
+
+# Preferred first when the client accepts several with the same weight
+SUPPORTED_ENCODINGS: Tuple[str, ...] = ((BROTLI,) if brotli is not None else ()) + (GZIP,)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == GZIP:
+        # mtime=0 keeps the output (and thus ETags derived from it) stable
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == BROTLI and brotli is not None:
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    raise ValueError(f"Unsupported encoding {encoding!r}")
+
+
+def negotiate(accept_encoding: Optional[str], body_size: int) -> str:
+    """
+    Picks the encoding for a response from the Accept-Encoding header:
+    the supported encoding with the highest q-value, or identity.
+    """
+    if not accept_encoding or body_size < MIN_COMPRESS_BYTES:
+        return IDENTITY
+
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name.strip().lower()] = weight
+
+    best, best_weight = IDENTITY, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = encoding, weight
+    return best
@@ -2,42 +2,129 @@ import yaml
 import importlib.util
 import os
 import logging
-from typing import List, Dict
+import time
+import threading
+import hashlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Dict, Optional, Tuple
 from pathlib import Path
-from .models import ProviderConfig, Event
+from .models import ProviderConfig, Event, event_to_row, event_from_row
 from .providers.interface import EventProvider
 
 logger = logging.getLogger(__name__)
 
+@dataclass(frozen=True)
+class ConfigSnapshot:
+    # Content hash of config.yaml; changes whenever the file content changes
+    revision: str
+    raw: Dict
+    providers: Tuple[ProviderConfig, ...]
+    global_config: Dict
+    # False if the file is missing, is not valid YAML or has invalid provider entries:
+    # the providers list may then be incomplete and must not be used to drop providers
+    valid: bool = True
+
+EMPTY_CONFIG = ConfigSnapshot(revision="empty", raw={"providers": []}, providers=(), global_config={}, valid=False)
+
 class ConfigLoader:
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = config_path
+        self._snapshot: ConfigSnapshot = EMPTY_CONFIG
+        # (mtime_ns, size) of the file the snapshot was built from
+        self._file_key: Optional[Tuple[int, int]] = None
+        # True while the file is missing, so that is only logged once
+        self._missing = False
+        self._lock = threading.Lock()
 
-    def load_config(self) -> Dict:
-        if not os.path.exists(self.config_path):
-            logger.warning(f"Config file not found at {self.config_path}")
-            return {"providers": []}
-        
-        with open(self.config_path, "r") as f:
+    def get_snapshot(self) -> ConfigSnapshot:
+        """
+        Returns the parsed and validated configuration.
+        The YAML is only re-parsed when the file's mtime or size changed and its content
+        hash differs from the cached one, so callers can ask for it on every request.
+        """
+        with self._lock:
             try:
-                return yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                logger.error(f"Error parsing YAML config: {e}")
-                return {"providers": []}
+                stat = os.stat(self.config_path)
+            except FileNotFoundError:
+                if not self._missing:
+                    logger.warning(f"Config file not found at {self.config_path}")
+                    self._missing = True
+                self._snapshot, self._file_key = EMPTY_CONFIG, None
+                return self._snapshot
+            self._missing = False
+
+            file_key = (stat.st_mtime_ns, stat.st_size)
+            if file_key == self._file_key:
+                return self._snapshot
+
+            with open(self.config_path, "rb") as f:
+                content = f.read()
+            revision = hashlib.sha256(content).hexdigest()[:16]
+            if revision != self._snapshot.revision:
+                self._snapshot = self._parse(content, revision)
+            self._file_key = file_key
+            return self._snapshot
+
+    def _parse(self, content: bytes, revision: str) -> ConfigSnapshot:
+        valid = True
+        try:
+            config = yaml.safe_load(content) or {}
+            if not isinstance(config, dict):
+                raise yaml.YAMLError(f"expected a mapping, got {type(config).__name__}")
+        except yaml.YAMLError as e:
+            logger.error(f"Error parsing YAML config: {e}")
+            config = {"providers": []}
+            valid = False
 
-    def get_providers_config(self) -> List[ProviderConfig]:
-        config = self.load_config()
         provider_configs = []
-        for p_conf in config.get("providers", []):
+        for p_conf in config.get("providers") or []:
             try:
                 provider_configs.append(ProviderConfig(**p_conf))
             except Exception as e:
                 logger.error(f"Invalid provider config: {p_conf}, error: {e}")
-        return provider_configs
+                valid = False
+
+        logger.info(f"Loaded config revision {revision} with {len(provider_configs)} providers.")
+        return ConfigSnapshot(
+            revision=revision,
+            raw=config,
+            providers=tuple(provider_configs),
+            global_config=config.get("global") or {},
+            valid=valid,
+        )
+
+    def load_config(self) -> Dict:
+        """
+        Returns the raw YAML content. The dict is shared between callers and must not be modified.
+        """
+        return self.get_snapshot().raw
+
+    def get_providers_config(self) -> List[ProviderConfig]:
+        return list(self.get_snapshot().providers)
+
+    def get_global_config(self) -> Dict:
+        return self.get_snapshot().global_config
+
+@dataclass
+class LoadedProviderModule:
+    file_path: str
+    mtime_ns: int
+    size: int
+    digest: str
+    instance: EventProvider
+    loads: int = 0
+    cache_hits: int = 0
+    last_load_seconds: float = 0.0
+    loaded_at: Optional[datetime] = None
 
 class ProviderLoader:
     def __init__(self, providers_dir: str = "app/providers"):
         self.providers_dir = providers_dir
+        # Loaded provider modules keyed by file path; reused until the file changes
+        self._modules: Dict[str, LoadedProviderModule] = {}
+        self._lock = threading.Lock()
 
     def load_provider(self, module_name: str) -> EventProvider:
         """
@@ -45,32 +132,162 @@ class ProviderLoader:
         Expects the module to have a class that inherits from EventProvider.
         Convention: The class should be named 'Provider' or the module should expose a 'get_provider()' function.
         For simplicity, let's assume the module must contain a class named 'Provider'.
+
+        Loaded modules are cached by file path. A cheap mtime/size check runs on every call
+        and the file is only re-executed when its content hash changed, so edited or newly
+        added providers are still picked up without a restart.
         """
         # module_name is like "example_provider.py"
         file_path = os.path.join(self.providers_dir, module_name)
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Provider module not found: {file_path}")
+        with self._lock:
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                self._modules.pop(file_path, None)
+                raise FileNotFoundError(f"Provider module not found: {file_path}")
 
+            cached = self._modules.get(file_path)
+            if cached is not None and (cached.mtime_ns, cached.size) == (stat.st_mtime_ns, stat.st_size):
+                cached.cache_hits += 1
+                return cached.instance
+
+            with open(file_path, "rb") as f:
+                source = f.read()
+            digest = hashlib.sha256(source).hexdigest()
+            if cached is not None and cached.digest == digest:
+                # Touched but unchanged (e.g. checkout or copy), keep the loaded instance
+                cached.mtime_ns, cached.size = stat.st_mtime_ns, stat.st_size
+                cached.cache_hits += 1
+                return cached.instance
+
+            started = time.perf_counter()
+            instance = self._load_instance(module_name, file_path, source)
+            if cached is None:
+                cached = LoadedProviderModule(file_path, stat.st_mtime_ns, stat.st_size, digest, instance)
+                self._modules[file_path] = cached
+            else:
+                logger.info(f"Provider module {module_name} changed, reloaded.")
+                cached.mtime_ns, cached.size, cached.digest, cached.instance = stat.st_mtime_ns, stat.st_size, digest, instance
+            cached.loads += 1
+            cached.last_load_seconds = time.perf_counter() - started
+            cached.loaded_at = datetime.now()
+            return instance
+
+    def _load_instance(self, module_name: str, file_path: str, source: bytes) -> EventProvider:
         spec = importlib.util.spec_from_file_location(module_name, file_path)
         if spec is None or spec.loader is None:
              raise ImportError(f"Could not load spec for {module_name}")
         
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # Execute the bytes that were hashed, so the cache key always matches the loaded code
+        exec(compile(source, file_path, "exec"), module.__dict__)
 
         # Find the class that inherits from EventProvider
         for attribute_name in dir(module):
             attribute = getattr(module, attribute_name)
             if isinstance(attribute, type) and issubclass(attribute, EventProvider) and attribute is not EventProvider:
+                if not attribute.is_implemented():
+                    raise ImportError(f"{attribute.__name__} in {module_name} must implement fetch_events() or fetch_source() and parse_events()")
                 return attribute()
         
         raise ImportError(f"No EventProvider implementation found in {module_name}")
 
+    def get_module_digest(self, module_name: str) -> Optional[str]:
+        module = self._modules.get(os.path.join(self.providers_dir, module_name))
+        return module.digest if module else None
+
+    def get_stats(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                os.path.basename(module.file_path): {
+                    "loads": module.loads,
+                    "cache_hits": module.cache_hits,
+                    "last_load_ms": round(module.last_load_seconds * 1000, 2),
+                    "loaded_at": module.loaded_at.isoformat() if module.loaded_at else None,
+                }
+                for module in self._modules.values()
+            }
+
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import timedelta
+import asyncio
+import httpx
+import multiprocessing
 from .storage import EventStorage
-from .geocoding import GeocodingService
+from .geocoding import GeocodingService, GEOCODE_LOOKUPS
+from .enrichment import DETAIL_PAGE_CACHE
+from .http_client import FetchEngine, DEFAULT_TIMEOUT, DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS_PER_HOST
+from .scheduler import ProviderScheduler, DEFAULT_UPDATE_INTERVAL
+from .replay import ArchiveGeocoder, RecordingTransport, ReplayTransport, archive_from_env
+from .metrics import REGISTRY, CollectedMetric, hit_ratio
+from . import clock
+
+# Used when config.yaml does not set global.max_concurrent_providers
+DEFAULT_MAX_CONCURRENT_PROVIDERS = 4
+# How often the scheduler reloads config.yaml and checks which providers are due
+SCHEDULER_TICK = timedelta(minutes=1)
+# Used when config.yaml does not set global.parse_workers
+DEFAULT_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+PROVIDER_PHASE_SECONDS = REGISTRY.summary("salon_provider_phase_seconds", "Time spent per provider and update phase (load, fetch, parse, enrich, store)", ["provider", "phase"])
+PROVIDER_UPDATES = REGISTRY.counter("salon_provider_updates_total", "Provider updates by result (updated, unchanged, failed, skipped)", ["provider", "result"])
+PROVIDER_EVENTS = REGISTRY.gauge("salon_provider_events", "Events stored by the last successful update", ["provider"])
+UPDATE_CYCLE_SECONDS = REGISTRY.summary("salon_update_cycle_seconds", "Duration of update cycles")
+
+def _update_digest(digest, value: Any):
+    if isinstance(value, str):
+        value = value.encode()
+    if isinstance(value, bytes):
+        digest.update(b"b%d:" % len(value))
+        digest.update(value)
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"l%d:" % len(value))
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, dict):
+        digest.update(b"d%d:" % len(value))
+        for key in sorted(value, key=repr):
+            _update_digest(digest, repr(key))
+            _update_digest(digest, value[key])
+    else:
+        _update_digest(digest, repr(value))
+
+def source_digest(*parts: Any) -> str:
+    """
+    Hashes a provider's raw fetch_source() payload (bytes, str or nested lists, tuples
+    and dicts of them) together with any extra context that influences parsing.
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        _update_digest(digest, part)
+    return digest.hexdigest()
+
+@contextmanager
+def _timed_phase(provider_id: str, phase: str, durations: Dict[str, float]):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        durations[phase] = elapsed
+        PROVIDER_PHASE_SECONDS.observe(elapsed, provider=provider_id, phase=phase)
+
+# Provider loaders of the parse worker processes, one per providers directory
+_worker_provider_loaders: Dict[str, ProviderLoader] = {}
+
+def _parse_in_worker(providers_dir: str, module_name: str, raw: Any) -> List[tuple]:
+    """
+    Runs a provider's parse step inside a parse worker process.
+    Events are returned as compact rows, which pickle much smaller than pydantic models.
+    """
+    loader = _worker_provider_loaders.get(providers_dir)
+    if loader is None:
+        loader = _worker_provider_loaders[providers_dir] = ProviderLoader(providers_dir)
+    provider = loader.load_provider(module_name)
+    return [event_to_row(event) for event in provider.parse_events(raw)]
 
 class ServiceOrchestrator:
     def __init__(self, config_loader: ConfigLoader, provider_loader: ProviderLoader, storage: EventStorage):
@@ -78,21 +295,75 @@ class ServiceOrchestrator:
         self.provider_loader = provider_loader
         self.storage = storage
         self.scheduler = BackgroundScheduler()
-        self.geocoding_service = GeocodingService()
+        self.provider_scheduler = ProviderScheduler()
+        # HTTP_REPLAY_MODE=record|replay: archive all outbound traffic or answer it from the archive
+        self.http_archive = archive_from_env()
+        self.geocoding_service = self._create_geocoding_service()
+        # One event loop and one pooled HTTP client shared by all providers
+        max_connections = self._global_setting("http_max_connections", DEFAULT_MAX_CONNECTIONS)
+        self.fetch_engine = FetchEngine(
+            timeout=self._global_setting("http_timeout", DEFAULT_TIMEOUT, float),
+            max_connections=max_connections,
+            max_connections_per_host=self._global_setting("http_max_connections_per_host", DEFAULT_MAX_CONNECTIONS_PER_HOST),
+            transport=self._create_transport(max_connections),
+        )
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._parse_pool_lock = threading.Lock()
+        self._parses_skipped: Dict[str, int] = {}
+        # Digest of the source payload (plus config and provider code) of the last stored run
+        self._source_digests: Dict[str, str] = {}
+        REGISTRY.register_collector("orchestrator", self._collect_metrics)
+
+    def _create_geocoding_service(self) -> GeocodingService:
+        if self.http_archive is None:
+            return GeocodingService()
+        # The persistent geocache would hide lookups from the recording
+        service = GeocodingService(persist_cache=False)
+        service.geolocator = ArchiveGeocoder(self.http_archive, service.geolocator)
+        if not self.http_archive.recording:
+            service.min_request_interval = 0.0
+        return service
+
+    def _create_transport(self, max_connections: int) -> Optional[httpx.AsyncBaseTransport]:
+        if self.http_archive is None:
+            return None
+        if not self.http_archive.recording:
+            return ReplayTransport(self.http_archive)
+        limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+        return RecordingTransport(self.http_archive, httpx.AsyncHTTPTransport(limits=limits))
 
     def start(self):
-        self.update_all_providers()
-        # Schedule the job to run periodically based on global config or hardcoded for now
-        # Ideally, we should parse the interval string (e.g., '24h') into something APScheduler understands.
-        # For simplify, let's just refresh config and reschedule periodically.
-        
-        # A simple approach: Run a "manager" job every X minutes that checks config and schedules actual provider jobs
-        # But per spec, "YAML is reloaded before each update cycle".
-        # Let's assume a global loop that runs every X time, reloading config and running providers.
-        
-        self.scheduler.add_job(self.update_all_providers, 'interval', minutes=15) # Check every 15 mins
+        # Per spec, "YAML is reloaded before each update cycle": a short tick reloads the
+        # config, re-syncs the provider schedules and runs only the providers that are due
+        # according to their own update_interval.
+        # The first tick runs right away in the scheduler thread, so startup does not wait
+        # for the providers (the API serves the restored events meanwhile).
+        # Providers updated recently by a previous leader or run only become due when
+        # their interval has passed since that update.
+        # (Recording and replaying cover all providers, so there all are due right away.)
+        if self.http_archive is None:
+            self.provider_scheduler.restore_last_success(self.storage.get_update_times())
+        self.scheduler.add_job(
+            self.update_due_providers,
+            IntervalTrigger(seconds=SCHEDULER_TICK.total_seconds()),
+            id="update_due_providers",
+            max_instances=1,
+            coalesce=True,
+            next_run_time=datetime.now(),
+        )
         self.scheduler.start()
 
+    def shutdown(self):
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        with self._parse_pool_lock:
+            if self._parse_pool is not None:
+                self._parse_pool.shutdown(cancel_futures=True)
+                self._parse_pool = None
+        self.fetch_engine.stop()
+        if self.http_archive is not None:
+            self.http_archive.save()
+
     def force_reload(self):
         """
         Manually triggers an immediate update of all providers.
@@ -101,47 +372,258 @@ class ServiceOrchestrator:
         logger.info("Force reload triggered via API.")
         self.update_all_providers()
 
+    def _global_setting(self, key: str, default, cast=int):
+        value = self.config_loader.get_global_config().get(key, default)
+        try:
+            value = cast(value)
+            if value <= 0:
+                raise ValueError(value)
+            return value
+        except (TypeError, ValueError):
+            logger.error(f"Invalid {key} '{value}', using {default}")
+            return default
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Returns the process pool for the parse stage, or None if parsing should stay in
+        worker threads (global.parse_workers: 0).
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                workers = self.config_loader.get_global_config().get("parse_workers", DEFAULT_PARSE_WORKERS)
+                if workers == 0:
+                    return None
+                workers = self._global_setting("parse_workers", DEFAULT_PARSE_WORKERS)
+                # "spawn" avoids forking a process that runs the scheduler and event loop threads
+                self._parse_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            return self._parse_pool
+
+    def _count_skipped_parse(self, provider_id: str):
+        self._parses_skipped[provider_id] = self._parses_skipped.get(provider_id, 0) + 1
+
+    def get_fetch_stats(self) -> Dict[str, dict]:
+        """
+        Per-provider HTTP cache statistics: requests, 304 responses, bytes downloaded and
+        saved, and how often parsing was skipped because nothing changed.
+        """
+        stats = self.fetch_engine.get_stats()
+        for provider_id, skipped in self._parses_skipped.items():
+            stats.setdefault(provider_id, {})["parses_skipped"] = skipped
+        return stats
+
+    def _collect_metrics(self) -> List[CollectedMetric]:
+        """
+        Exposes the counters kept by the HTTP client and the module loader at scrape time.
+        """
+        http_stats = self.get_fetch_stats()
+        module_stats = self.provider_loader.get_stats()
+
+        def per_provider(key: str):
+            return [({"provider": provider_id}, stats.get(key, 0)) for provider_id, stats in http_stats.items()]
+
+        def family(name: str, help_text: str, type_name: str, samples):
+            return CollectedMetric(name, help_text, type_name, [(name, labels, value) for labels, value in samples])
+
+        requests = sum(stats.get("requests", 0) for stats in http_stats.values())
+        not_modified = sum(stats.get("not_modified", 0) for stats in http_stats.values())
+        loads = sum(stats["loads"] for stats in module_stats.values())
+        module_hits = sum(stats["cache_hits"] for stats in module_stats.values())
+        geocode_hits = GEOCODE_LOOKUPS.get(result="hit")
+        geocode_total = geocode_hits + GEOCODE_LOOKUPS.get(result="miss")
+        detail_hits = DETAIL_PAGE_CACHE.get(result="hit")
+        detail_total = detail_hits + DETAIL_PAGE_CACHE.get(result="miss")
+        ratios = [
+            ({"cache": cache}, ratio)
+            for cache, ratio in (
+                ("http_not_modified", hit_ratio(not_modified, requests)),
+                ("provider_modules", hit_ratio(module_hits, module_hits + loads)),
+                ("geocode", hit_ratio(geocode_hits, geocode_total)),
+                ("detail_pages", hit_ratio(detail_hits, detail_total)),
+            )
+            if ratio is not None
+        ]
+
+        return [
+            family("salon_http_requests_total", "HTTP requests made by providers", "counter", per_provider("requests")),
+            family("salon_http_not_modified_total", "Requests answered with 304 Not Modified", "counter", per_provider("not_modified")),
+            family("salon_http_downloaded_bytes_total", "Response bytes downloaded", "counter", per_provider("bytes_downloaded")),
+            family("salon_http_saved_bytes_total", "Response bytes served from the HTTP cache after a 304", "counter", per_provider("bytes_saved")),
+            family("salon_provider_parses_skipped_total", "Updates that skipped parsing because the source was unchanged", "counter", per_provider("parses_skipped")),
+            family("salon_provider_module_loads_total", "Provider module (re)loads from disk", "counter",
+                   [({"module": module}, stats["loads"]) for module, stats in module_stats.items()]),
+            family("salon_provider_module_cache_hits_total", "Provider module lookups served from the cache", "counter",
+                   [({"module": module}, stats["cache_hits"]) for module, stats in module_stats.items()]),
+            family("salon_cache_hit_ratio", "Share of lookups answered from a cache", "gauge", ratios),
+        ]
+
+    def get_enabled_provider_ids(self) -> Optional[List[str]]:
+        """
+        Ids of the enabled providers, or None unless the config file was read and
+        validated cleanly (its provider list may be incomplete then, so stored events
+        are kept).
+        """
+        snapshot = self.config_loader.get_snapshot()
+        if not snapshot.valid:
+            return None
+        return [config.id for config in snapshot.providers if config.enabled]
+
+    def _sync_schedules(self) -> List[ProviderConfig]:
+        configs = [config for config in self.config_loader.get_providers_config() if config.enabled]
+        default_interval = self.config_loader.get_global_config().get("default_update_interval", DEFAULT_UPDATE_INTERVAL)
+        self.provider_scheduler.sync(configs, default_interval)
+
+        # Providers removed or disabled in the config stop serving their last events
+        enabled_ids = self.get_enabled_provider_ids()
+        if enabled_ids is not None:
+            for provider_id in self.storage.retain_providers(enabled_ids):
+                self._source_digests.pop(provider_id, None)
+                logger.info(f"Provider {provider_id} is no longer enabled, removed its stored events.")
+        return configs
+
+    def update_due_providers(self):
+        if self.storage.take_refresh_request():
+            # POST /refresh was called on an API worker that does not run the scraper
+            logger.info("Force reload requested through the shared event store.")
+            self.update_all_providers()
+            return
+        configs = self._sync_schedules()
+        due = self.provider_scheduler.due_providers(configs)
+        if due:
+            self._run_providers(due)
+
     def update_all_providers(self):
-        logger.info("Starting update cycle...")
-        configs = self.config_loader.get_providers_config()
-        
-        for config in configs:
-            if not config.enabled:
-                continue
-            
+        self._run_providers(self._sync_schedules())
+
+    def _run_providers(self, configs: List[ProviderConfig]):
+        logger.info(f"Starting update cycle for {len(configs)} providers...")
+        max_workers = self._global_setting("max_concurrent_providers", DEFAULT_MAX_CONCURRENT_PROVIDERS)
+        started = time.monotonic()
+
+        # Downloads run concurrently on the fetch engine's event loop, so the cycle takes
+        # roughly as long as the slowest provider. Blocking steps (module loading, parsing,
+        # geocoding and legacy providers) use a bounded thread pool.
+        with UPDATE_CYCLE_SECONDS.time(), ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="provider") as executor:
+            results = self.fetch_engine.run(self._run_providers_async(configs, max_workers, executor))
+
+        logger.info(
+            f"Update cycle finished in {time.monotonic() - started:.1f}s: "
+            f"{sum(results)}/{len(configs)} providers updated (max {max_workers} concurrent)."
+        )
+        if self.http_archive is not None:
+            self.http_archive.finish_cycle()
+
+    async def _run_providers_async(self, configs: List[ProviderConfig], max_concurrent: int, executor: Executor) -> List[bool]:
+        semaphore = asyncio.Semaphore(max_concurrent)
+
+        async def run(config: ProviderConfig) -> bool:
+            async with semaphore:
+                return await self.update_provider(config, executor)
+
+        return await asyncio.gather(*(run(config) for config in configs))
+
+    async def update_provider(self, config: ProviderConfig, executor: Executor) -> bool:
+        """
+        Fetches, enriches and stores the events of a single provider.
+        Failures are logged with provider context and never propagate, so one
+        broken provider cannot affect the others running in the same cycle.
+        """
+        if not self.provider_scheduler.claim(config.id):
+            logger.info(f"Provider {config.id} is already being updated, skipping.")
+            PROVIDER_UPDATES.inc(provider=config.id, result="skipped")
+            return False
+
+        loop = asyncio.get_running_loop()
+        durations: Dict[str, float] = {}
+        try:
+            logger.info(f"Updating provider {config.id}...")
+            started = time.monotonic()
+            with _timed_phase(config.id, "load", durations):
+                provider = await loop.run_in_executor(executor, self.provider_loader.load_provider, config.module)
+            digest = None
+
+            if provider.supports_async_fetch():
+                client = self.fetch_engine.client.bind(config.id)
+                with _timed_phase(config.id, "fetch", durations):
+                    raw = await provider.fetch_source(client)
+                digest = source_digest(raw, config.model_dump_json(), self.provider_loader.get_module_digest(config.module), clock.today().isoformat())
+                if self._source_digests.get(config.id) == digest:
+                    # Same payload, config, provider code and day as the last stored run:
+                    # parsing, geocoding and storing would produce the same events again
+                    self._count_skipped_parse(config.id)
+                    await loop.run_in_executor(executor, self.storage.confirm_provider, config.id)
+                    self.provider_scheduler.mark_success(config.id)
+                    PROVIDER_UPDATES.inc(provider=config.id, result="unchanged")
+                    reason = "not modified (304)" if client.all_not_modified else "unchanged"
+                    logger.info(f"Provider {config.id} source {reason}, keeping stored events.")
+                    return True
+                with _timed_phase(config.id, "parse", durations):
+                    events = await self._parse_events(config, provider, raw, executor)
+            else:
+                # Sync adapter: providers that only implement fetch_events block a worker thread
+                with _timed_phase(config.id, "fetch", durations):
+                    events = await loop.run_in_executor(executor, provider.fetch_events)
+
+            with _timed_phase(config.id, "enrich", durations):
+                await loop.run_in_executor(executor, self._enrich_events, config, events)
+
+            with _timed_phase(config.id, "store", durations):
+                # Index merge, compression and the SQLite write must not block the downloads
+                await loop.run_in_executor(executor, self.storage.save_events, config.id, events)
+            if digest is not None:
+                self._source_digests[config.id] = digest
+            self.provider_scheduler.mark_success(config.id)
+            PROVIDER_UPDATES.inc(provider=config.id, result="updated")
+            PROVIDER_EVENTS.set(len(events), provider=config.id)
+            phases = ", ".join(f"{phase} {seconds:.1f}s" for phase, seconds in durations.items())
+            logger.info(f"Updated {config.id}: {len(events)} events fetched in {time.monotonic() - started:.1f}s ({phases}).")
+            return True
+        except Exception as e:
+            self.provider_scheduler.mark_failure(config.id)
+            PROVIDER_UPDATES.inc(provider=config.id, result="failed")
+            logger.error(f"Failed to update provider {config.id}: {e!r}")
+            return False
+
+    async def _parse_events(self, config: ProviderConfig, provider: EventProvider, raw: Any, executor: Executor) -> List[Event]:
+        """
+        Parses in the process pool so CPU-bound BeautifulSoup work neither holds the GIL
+        of the API process nor serializes providers on a single core.
+        """
+        loop = asyncio.get_running_loop()
+        parse_pool = self._get_parse_pool()
+        if parse_pool is not None:
+            providers_dir = os.path.abspath(self.provider_loader.providers_dir)
             try:
-                # In a real dynamic scheduler, we would check if it's time to update this specific provider.
-                # For this MVP, we just run all enabled providers when the cycle runs.
-                logger.info(f"Updating provider {config.id}...")
-                provider = self.provider_loader.load_provider(config.module)
-                events = provider.fetch_events()
-                
-                # Enrich with geocoding or provider-level override
-                for event in events:
-                    # 1. First, check if provider has a global configuration (Single-Location Provider)
-                    # If so, and event has no specific location, use it.
-                    if config.address and not event.location:
-                         event.location = config.address
-                    
-                    # 2. Try to get coordinates via Geocoding Service
-                    # This will check cache first. If cache has 'null' (failure), it returns None, None quickly.
-                    if event.location and (event.latitude is None or event.longitude is None):
-                        query = event.location.replace("\n", ", ")
-                        lat, lon = self.geocoding_service.get_coordinates(query)
-                        
-                        if lat and lon:
-                            event.latitude = lat
-                            event.longitude = lon
-                        else:
-                            # Geocoding failed (or was cached as failed).
-                            # Fallback: If provider has global coordinates, use them as "default region/location".
-                            # This fits the requirement: "Falls also dort eine Null eingetragen wird, sind sofort der oder die Location von dem Provider eingetragen."
-                            if config.latitude and config.longitude:
-                                event.latitude = config.latitude
-                                event.longitude = config.longitude
-
-                self.storage.save_events(config.id, events)
-                logger.info(f"Updated {config.id}: {len(events)} events fetched.")
-            except Exception as e:
-                logger.error(f"Failed to update provider {config.id}: {e}")
+                rows = await loop.run_in_executor(parse_pool, _parse_in_worker, providers_dir, config.module, raw)
+                return [event_from_row(row) for row in rows]
+            except BrokenProcessPool:
+                logger.error(f"Parse worker crashed while parsing {config.id}, parsing in-process instead.")
+                with self._parse_pool_lock:
+                    if self._parse_pool is parse_pool:
+                        self._parse_pool = None
+
+        return await loop.run_in_executor(executor, provider.parse_events, raw)
 
+    def _enrich_events(self, config: ProviderConfig, events: List[Event]):
+        # Enrich with geocoding or provider-level override
+        for event in events:
+            # 1. First, check if provider has a global configuration (Single-Location Provider)
+            # If so, and event has no specific location, use it.
+            if config.address and not event.location:
+                 event.location = config.address
+            
+            # 2. Try to get coordinates via Geocoding Service
+            # This will check cache first. If cache has 'null' (failure), it returns None, None quickly.
+            if event.location and (event.latitude is None or event.longitude is None):
+                query = event.location.replace("\n", ", ")
+                lat, lon = self.geocoding_service.get_coordinates(query)
+                
+                if lat and lon:
+                    event.latitude = lat
+                    event.longitude = lon
+                else:
+                    # Geocoding failed (or was cached as failed).
+                    # Fallback: If provider has global coordinates, use them as "default region/location".
+                    # This fits the requirement: "Falls also dort eine Null eingetragen wird, sind sofort der oder die Location von dem Provider eingetragen."
+                    if config.latitude and config.longitude:
+                        event.latitude = config.latitude
+                        event.longitude = config.longitude
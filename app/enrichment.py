@@ -0,0 +1,120 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+from urllib.parse import urlsplit
+
+from .http_client import AsyncHttpClient
+from .metrics import REGISTRY
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DETAIL_TTL = 24 * 60 * 60
+DEFAULT_DETAIL_CONCURRENCY = 4
+DEFAULT_HOST_DELAY = 0.25
+
+DETAIL_PAGE_CACHE = REGISTRY.counter("salon_detail_page_cache_total", "Detail page lookups answered from the cache (hit) or downloaded (miss)", ["result"])
+
+
+@dataclass
+class CachedDetail:
+    value: Any
+    expires_at: float
+
+
+class DetailPageEnricher:
+    """
+    Fetches the detail pages of list-based providers (one extra request per event)
+    concurrently and remembers the extracted result per URL for a TTL, so pages of
+    already known events are not downloaded again on every cycle.
+
+    Politeness: at most `concurrency` detail pages are in flight per call, and requests
+    to the same host are started at least `host_delay` seconds apart.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DETAIL_TTL,
+        concurrency: int = DEFAULT_DETAIL_CONCURRENCY,
+        host_delay: float = DEFAULT_HOST_DELAY,
+    ):
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.host_delay = host_delay
+        self._cache: Dict[str, CachedDetail] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _get_cached(self, url: str, now: float) -> Optional[CachedDetail]:
+        cached = self._cache.get(url)
+        if cached is not None and cached.expires_at > now:
+            return cached
+        return None
+
+    async def fetch(
+        self,
+        client: AsyncHttpClient,
+        urls: Iterable[str],
+        extract: Callable[[bytes], Any],
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Returns {url: extract(page content)} for all given URLs.
+        Pages that cannot be fetched or extracted map to None and are retried next time.
+        """
+        now = time.monotonic()
+        results: Dict[str, Any] = {}
+        missing = []
+        for url in dict.fromkeys(urls):
+            cached = self._get_cached(url, now)
+            if cached is not None:
+                self.hits += 1
+                results[url] = cached.value
+            else:
+                self.misses += 1
+                missing.append(url)
+        DETAIL_PAGE_CACHE.inc(len(results), result="hit")
+        DETAIL_PAGE_CACHE.inc(len(missing), result="miss")
+
+        if not missing:
+            return results
+
+        # Created per call: asyncio primitives are bound to the loop that uses them
+        semaphore = asyncio.Semaphore(self.concurrency)
+        host_locks: Dict[str, asyncio.Lock] = {}
+        next_request_at: Dict[str, float] = {}
+        loop = asyncio.get_running_loop()
+
+        async def wait_for_host(url: str):
+            host = urlsplit(url).netloc.lower()
+            async with host_locks.setdefault(host, asyncio.Lock()):
+                delay = next_request_at.get(host, 0.0) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_request_at[host] = time.monotonic() + self.host_delay
+
+        async def fetch_one(url: str):
+            async with semaphore:
+                await wait_for_host(url)
+                try:
+                    response = await client.get(url, headers=headers, timeout=timeout)
+                    response.raise_for_status()
+                    # Extraction parses HTML, keep it off the event loop
+                    value = await loop.run_in_executor(None, extract, response.content)
+                except Exception as e:
+                    logger.warning(f"Could not fetch/parse detail page {url}: {e!r}")
+                    results[url] = None
+                    return
+            results[url] = value
+            self._cache[url] = CachedDetail(value, time.monotonic() + self.ttl)
+
+        await asyncio.gather(*(fetch_one(url) for url in missing))
+        self._evict_expired()
+        return results
+
+    def _evict_expired(self):
+        now = time.monotonic()
+        for url in [url for url, cached in self._cache.items() if cached.expires_at <= now]:
+            del self._cache[url]
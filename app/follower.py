@@ -0,0 +1,45 @@
+import logging
+import os
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from .storage import EventStorage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POLL_INTERVAL = 2.0
+
+
+class StoreFollower:
+    """
+    Keeps the storage of a process that does not run the scraper in sync with the shared
+    event store. Each poll only reads the store's generation; providers are loaded when
+    the scraping process has published new events.
+    """
+
+    def __init__(self, storage: EventStorage, interval: float = None):
+        self.storage = storage
+        self.interval = interval or float(os.getenv("STORE_POLL_INTERVAL", DEFAULT_POLL_INTERVAL))
+        self.scheduler = BackgroundScheduler()
+
+    def start(self):
+        self.scheduler.add_job(
+            self.sync,
+            IntervalTrigger(seconds=self.interval),
+            id="sync_from_store",
+            max_instances=1,
+            coalesce=True,
+        )
+        self.scheduler.start()
+
+    def shutdown(self):
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+
+    def sync(self):
+        try:
+            if self.storage.sync_from_store():
+                logger.info(f"Loaded events published to the shared store, now at generation {self.storage.generation}.")
+        except Exception as e:
+            logger.error(f"Failed to sync events from the shared store: {e!r}")
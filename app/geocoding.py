@@ -3,22 +3,31 @@ import logging
 import json
 import os
 import time
-from threading import Lock
+from threading import Lock, local
 from typing import Optional, Tuple
 from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
+from .metrics import REGISTRY
+
 logger = logging.getLogger(__name__)
 
+GEOCODE_LOOKUPS = REGISTRY.counter("salon_geocode_lookups_total", "Coordinate lookups, answered from the geocache (hit) or by Nominatim (miss)", ["result"])
+GEOCODE_REQUESTS = REGISTRY.summary("salon_geocode_request_seconds", "Duration of Nominatim requests")
+GEOCODE_RATE_LIMIT_WAIT = REGISTRY.counter("salon_geocode_rate_limit_wait_seconds_total", "Time spent waiting for the Nominatim rate limit")
+
 class GeocodingService:
-    def __init__(self, cache_file: Optional[str] = None, user_agent: str = "salon_der_gedanken_service"):
+    def __init__(self, cache_file: Optional[str] = None, user_agent: str = "salon_der_gedanken_service", persist_cache: bool = True):
         self.cache_file = cache_file or os.getenv("GEOCACHE_FILE", "geocache.json")
         self.user_agent = user_agent
-        self.cache = self._load_cache()
+        # Without persistence every lookup of a run reaches the geocoder (used for record/replay)
+        self.persist_cache = persist_cache
+        self.cache = self._load_cache() if persist_cache else {}
         self.cache_lock = Lock()
         self.request_lock = Lock()
         self.min_request_interval = float(os.getenv("GEOCODING_MIN_REQUEST_INTERVAL", "1.0"))
         self.last_request_time = 0.0
+        self._local = local()
         self.geolocator = Nominatim(user_agent=self.user_agent)
 
     def _load_cache(self) -> dict:
@@ -32,6 +41,8 @@ class GeocodingService:
         return {}
 
     def _save_cache(self):
+        if not self.persist_cache:
+            return
         with self.cache_lock:
             try:
                 with open(self.cache_file, "w") as f:
@@ -55,13 +66,25 @@ class GeocodingService:
             elapsed = time.monotonic() - self.last_request_time
             wait_time = self.min_request_interval - elapsed
             if wait_time > 0:
+                GEOCODE_RATE_LIMIT_WAIT.inc(wait_time)
                 time.sleep(wait_time)
 
-            location = self.geolocator.geocode(query, timeout=10)
+            self._local.requested = True
+            with GEOCODE_REQUESTS.time():
+                location = self.geolocator.geocode(query, timeout=10)
             self.last_request_time = time.monotonic()
             return location
 
     def get_coordinates(self, location_query: str) -> Tuple[Optional[float], Optional[float]]:
+        if not location_query:
+            return None, None
+
+        self._local.requested = False
+        coordinates = self._lookup_coordinates(location_query)
+        GEOCODE_LOOKUPS.inc(result="miss" if self._local.requested else "hit")
+        return coordinates
+
+    def _lookup_coordinates(self, location_query: str) -> Tuple[Optional[float], Optional[float]]:
         """
         Get coordinates for a location query.
         Tries to fetch from cache first.
@@ -0,0 +1,241 @@
+import asyncio
+import copy
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Coroutine, Dict, Optional
+from urllib.parse import urlsplit
+
+import charset_normalizer
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 20.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 2
+# Bodies kept for revalidation; the least recently requested URLs are dropped beyond this
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def apparent_encoding(content: bytes) -> Optional[str]:
+    """
+    Guesses the encoding of a response body, like requests' Response.apparent_encoding.
+    """
+    match = charset_normalizer.from_bytes(content).best()
+    return match.encoding if match else None
+
+
+@dataclass
+class CachedResponse:
+    content: bytes
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+@dataclass
+class ProviderHttpStats:
+    requests: int = 0
+    not_modified: int = 0
+    bytes_downloaded: int = 0
+    bytes_saved: int = 0
+
+
+class HttpCache:
+    """
+    Keeps the body and validators (ETag / Last-Modified) of responses that have them,
+    so the next request for the same URL can be made conditional.
+
+    Bodies are bounded by max_bytes in least-recently-requested order, so URLs that are
+    never requested again (superseded hashed bundles, old detail pages) age out.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._size = 0
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+
+    def _remove(self, url: str):
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= len(entry.content)
+
+    def store(self, url: str, response: httpx.Response):
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        cache_control = response.headers.get("cache-control", "").lower()
+        self._remove(url)
+        if response.status_code != 200 or not (etag or last_modified) or "no-store" in cache_control:
+            return
+        if len(response.content) > self.max_bytes:
+            return
+        self._entries[url] = CachedResponse(response.content, response.headers.get("content-type"), etag, last_modified)
+        self._size += len(response.content)
+        while self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+
+
+class AsyncHttpClient:
+    """
+    Shared HTTP client for provider downloads.
+    Wraps a pooled, keep-alive httpx.AsyncClient, enforces a timeout on every request
+    and limits the number of parallel requests per host so concurrent providers stay
+    polite towards venues that share a server.
+
+    Responses with validators are cached and revalidated with conditional requests.
+    A 304 is answered with the cached body (marked with the "not_modified" extension),
+    so providers never see the difference.
+    """
+
+    def __init__(
+        self,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.cache = cache if cache is not None else HttpCache()
+        self.provider_id: Optional[str] = None
+        self._provider_stats: Dict[str, ProviderHttpStats] = {}
+        self._request_count = 0
+        self._not_modified_count = 0
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            follow_redirects=True,
+            transport=transport,
+        )
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def bind(self, provider_id: str) -> "AsyncHttpClient":
+        """
+        Returns a view of this client for one provider run. It shares the connection pool
+        and cache, but counts requests separately so the caller can tell whether every
+        download of the run was answered with 304 Not Modified. Views must not be closed.
+        """
+        view = copy.copy(self)
+        view.provider_id = provider_id
+        view._request_count = 0
+        view._not_modified_count = 0
+        return view
+
+    @property
+    def all_not_modified(self) -> bool:
+        return self._request_count > 0 and self._request_count == self._not_modified_count
+
+    def get_stats(self) -> Dict[str, dict]:
+        return {provider_id: asdict(stats) for provider_id, stats in self._provider_stats.items()}
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None) -> httpx.Response:
+        cached = self.cache.get(url)
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached.etag:
+                request_headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                request_headers["If-Modified-Since"] = cached.last_modified
+
+        async with self._host_semaphore(url):
+            if timeout is None:
+                response = await self._client.get(url, headers=request_headers)
+            else:
+                response = await self._client.get(url, headers=request_headers, timeout=timeout)
+
+        stats = self._provider_stats.setdefault(self.provider_id or "", ProviderHttpStats())
+        stats.requests += 1
+        self._request_count += 1
+
+        if response.status_code == 304 and cached is not None:
+            stats.not_modified += 1
+            stats.bytes_saved += len(cached.content)
+            self._not_modified_count += 1
+            headers = {"content-type": cached.content_type} if cached.content_type else {}
+            return httpx.Response(
+                200,
+                headers=headers,
+                content=cached.content,
+                request=response.request,
+                extensions={"not_modified": True},
+            )
+
+        stats.bytes_downloaded += len(response.content)
+        self.cache.store(url, response)
+        return response
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncHttpClient":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+
+class FetchEngine:
+    """
+    Runs a single asyncio event loop in a background thread that drives all provider
+    downloads over one shared AsyncHttpClient. Blocking callers (the scheduler thread,
+    FastAPI background tasks) hand coroutines to the loop via run().
+    """
+
+    def __init__(self, **client_options):
+        self.client_options = client_options
+        self.client: Optional[AsyncHttpClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="fetch-engine", daemon=True)
+                thread.start()
+                # The client (and its connection pool) must be created on the loop that uses it
+                self.client = asyncio.run_coroutine_threadsafe(self._create_client(), loop).result()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    async def _create_client(self) -> AsyncHttpClient:
+        return AsyncHttpClient(**self.client_options)
+
+    def get_stats(self) -> Dict[str, dict]:
+        return self.client.get_stats() if self.client is not None else {}
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        """
+        Executes a coroutine on the engine loop and blocks until it has finished.
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+    def stop(self):
+        with self._lock:
+            if self._loop is None:
+                return
+            loop, thread, client = self._loop, self._thread, self.client
+            self._loop = self._thread = self.client = None
+
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
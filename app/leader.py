@@ -0,0 +1,101 @@
+import logging
+import os
+import socket
+from typing import Callable, Optional
+
+from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETRY_INTERVAL = 10.0
+
+
+class LeaderElection:
+    """
+    Elects the one process that runs the scraper among all processes sharing the data
+    volume (API workers, container replicas, a standalone app.scraper), using an exclusive
+    flock on LEADER_LOCK_FILE.
+
+    The operating system releases the lock when the leader exits or dies, so a follower
+    takes over with its next attempt (every `retry_interval` seconds). A leader keeps the
+    lock until it shuts down.
+    """
+
+    def __init__(self, on_elected: Callable[[], None], lock_file: Optional[str] = None, retry_interval: Optional[float] = None):
+        self.on_elected = on_elected
+        self.lock_file = lock_file or os.getenv("LEADER_LOCK_FILE", "leader.lock")
+        self.retry_interval = retry_interval or float(os.getenv("LEADER_RETRY_INTERVAL", DEFAULT_RETRY_INTERVAL))
+        self.is_leader = False
+        self._file = None
+        self.scheduler = BackgroundScheduler()
+
+    def start(self):
+        """
+        Tries to become leader right away, otherwise keeps trying in the background.
+        on_elected is called (once) in the thread that wins the lock.
+        """
+        if not self._try_acquire():
+            self._schedule_retries()
+
+    def _schedule_retries(self):
+        self.scheduler.add_job(
+            self._try_acquire,
+            IntervalTrigger(seconds=self.retry_interval),
+            id="leader_election",
+            max_instances=1,
+            coalesce=True,
+            replace_existing=True,
+        )
+        if not self.scheduler.running:
+            self.scheduler.start()
+
+    def _try_acquire(self) -> bool:
+        if self.is_leader:
+            return True
+        if fcntl is None:
+            logger.warning("File locks are not supported on this platform, assuming a single process.")
+        else:
+            lock = open(self.lock_file, "a+")
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock.close()
+                return False
+            # Only informational: who holds the lock
+            lock.seek(0)
+            lock.truncate()
+            lock.write(f"{socket.gethostname()} {os.getpid()}\n")
+            lock.flush()
+            self._file = lock
+
+        self.is_leader = True
+        logger.info(f"Elected leader (pid {os.getpid()}), starting the scraper.")
+        if self.scheduler.get_job("leader_election") is not None:
+            self.scheduler.remove_job("leader_election")
+        try:
+            self.on_elected()
+        except Exception as e:
+            # A leader that does not scrape must not keep the lock: let another process win
+            logger.error(f"Failed to start as leader, stepping down: {e!r}")
+            self._release()
+            self._schedule_retries()
+            return False
+        return True
+
+    def _release(self):
+        if self._file is not None:
+            # Closing the file releases the lock for the followers
+            self._file.close()
+            self._file = None
+        self.is_leader = False
+
+    def shutdown(self):
+        if self.scheduler.running:
+            self.scheduler.shutdown(wait=False)
+        self._release()
@@ -0,0 +1,187 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# One exposed sample: (metric name, labels, value)
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+    return f"{name}{{{label_text}}} {_format_value(value)}"
+
+
+class Metric:
+    """
+    Base class of the in-process metrics. Updating a metric is a dict operation under a
+    lock; formatting only happens when /metrics is scraped.
+    """
+    type_name = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        return [(self.name, dict(zip(self.labelnames, key)), value) for key, value in items]
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def get(self, **labels: str) -> float:
+        key = self._key(labels)
+        with self._lock:
+            return self._values.get(key, 0)
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(Metric):
+    type_name = "gauge"
+
+    def set(self, value: float, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Summary(Metric):
+    """
+    Count and sum of observations (e.g. durations), without quantiles.
+    """
+    type_name = "summary"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._counts: Dict[Tuple[str, ...], int] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+            self._counts[key] = self._counts.get(key, 0) + 1
+
+    @contextmanager
+    def time(self, **labels: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def samples(self) -> List[Sample]:
+        with self._lock:
+            items = [(key, value, self._counts[key]) for key, value in self._values.items()]
+        samples = []
+        for key, total, count in items:
+            labels = dict(zip(self.labelnames, key))
+            samples.append((f"{self.name}_sum", labels, total))
+            samples.append((f"{self.name}_count", labels, count))
+        return samples
+
+
+class CollectedMetric:
+    """
+    Metric family produced by a collector callback at scrape time.
+    """
+
+    def __init__(self, name: str, help_text: str, type_name: str, samples: Iterable[Sample]):
+        self.name = name
+        self.help_text = help_text
+        self.type_name = type_name
+        self._samples = list(samples)
+
+    def samples(self) -> List[Sample]:
+        return self._samples
+
+
+class MetricsRegistry:
+    """
+    Holds the service metrics and renders them in the Prometheus text exposition format.
+    Values that already exist elsewhere (HTTP cache stats, module cache, stored events)
+    are not duplicated: collectors read them only when the endpoint is scraped.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[CollectedMetric]]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: Metric) -> Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                # Modules can be imported more than once (provider reloads, tests)
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def summary(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Summary:
+        return self._register(Summary(name, help_text, labelnames))
+
+    def register_collector(self, key: str, collector: Callable[[], Iterable[CollectedMetric]]):
+        """
+        Registers (or replaces) a callback that returns metric families when scraped.
+        """
+        with self._lock:
+            self._collectors[key] = collector
+
+    def render(self) -> str:
+        with self._lock:
+            families = list(self._metrics.values())
+            collectors = list(self._collectors.values())
+        for collector in collectors:
+            families.extend(collector())
+
+        lines = []
+        for family in families:
+            samples = family.samples()
+            if not samples:
+                continue
+            lines.append(f"# HELP {family.name} {family.help_text}")
+            lines.append(f"# TYPE {family.name} {family.type_name}")
+            lines.extend(_format_sample(name, labels, value) for name, labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def hit_ratio(hits: float, total: float) -> Optional[float]:
+    return hits / total if total else None
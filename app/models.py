@@ -1,6 +1,7 @@
-from pydantic import BaseModel, HttpUrl
-from typing import Optional, List
-from datetime import datetime
+import sys
+from pydantic import BaseModel, ConfigDict, HttpUrl, TypeAdapter
+from typing import Any, Dict, Optional, List
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 
 class Event(BaseModel):
@@ -17,12 +18,163 @@ class Event(BaseModel):
     latitude: Optional[float] = None
     longitude: Optional[float] = None
 
+class NearbyEvent(Event):
+    distance_km: float
+
+class EventChanges(BaseModel):
+    token: str
+    resync: bool  # True: the token is unknown or too old, reload all events via /events
+    changed: List[Event]  # added or updated since the token
+    removed: List[str]  # ids of events removed since the token
+
+# Serializes stored events (EventRecord.to_dict) without building and validating Event models
+JSON_ADAPTER = TypeAdapter(Any)
+
+# Field order of the compact tuple form used to ship events between processes
+EVENT_FIELDS = tuple(Event.model_fields)
+
+def event_to_row(event: Event) -> tuple:
+    """
+    Converts an event into a compact, picklable tuple of plain values (in EVENT_FIELDS order).
+    """
+    return tuple(
+        str(value) if name == "source_url" else value
+        for name, value in ((name, getattr(event, name)) for name in EVENT_FIELDS)
+    )
+
+def event_from_row(row: tuple) -> Event:
+    return Event.model_validate(dict(zip(EVENT_FIELDS, row)))
+
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+# One shared tzinfo object per UTC offset, so stored events only hold a reference
+_TIMEZONES: Dict[timedelta, timezone] = {}
+
+def wall_seconds(moment: datetime) -> int:
+    """
+    Seconds from 1970-01-01 to the wall-clock time of `moment`, ignoring its time zone.
+    """
+    return (moment.replace(tzinfo=None) - _EPOCH) // _SECOND
+
+def _shared_timezone(moment: Optional[datetime]) -> Optional[timezone]:
+    offset = moment.utcoffset() if moment is not None else None
+    return _timezone_for(offset)
+
+def _timezone_for(offset: Optional[timedelta]) -> Optional[timezone]:
+    if offset is None:
+        return None
+    tz = _TIMEZONES.get(offset)
+    if tz is None:
+        tz = _TIMEZONES.setdefault(offset, timezone(offset))
+    return tz
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if value is not None else None
+
+class EventRecord:
+    """
+    Compact stored form of an Event. Uses slots instead of a model instance, interns the
+    strings that repeat across events (provider, region, location, URLs, titles of
+    recurring events) and keeps dates as integer wall-clock seconds plus a shared UTC
+    offset. Sub-second parts of dates are dropped.
+
+    Records are converted back to Event only when a response is built.
+    """
+    __slots__ = (
+        "id", "title", "description", "start", "start_tz", "end", "end_tz", "cost",
+        "location", "provider_id", "source_url", "region", "latitude", "longitude",
+    )
+
+    @classmethod
+    def from_event(cls, event: Event) -> "EventRecord":
+        record = cls.__new__(cls)
+        record.id = event.id
+        record.title = _intern(event.title)
+        record.description = _intern(event.description)
+        record.start = wall_seconds(event.start_date)
+        record.start_tz = _shared_timezone(event.start_date)
+        record.end = wall_seconds(event.end_date) if event.end_date is not None else None
+        record.end_tz = _shared_timezone(event.end_date)
+        record.cost = _intern(event.cost)
+        record.location = _intern(event.location)
+        record.provider_id = _intern(event.provider_id)
+        record.source_url = _intern(str(event.source_url))
+        record.region = _intern(event.region)
+        record.latitude = event.latitude
+        record.longitude = event.longitude
+        return record
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "EventRecord":
+        """
+        Inverse of to_row(). Skips model validation, so rows must come from to_row().
+        """
+        record = cls.__new__(cls)
+        (
+            record.id, title, description, record.start, start_offset, record.end, end_offset,
+            cost, location, provider_id, source_url, region, record.latitude, record.longitude,
+        ) = row
+        record.title = _intern(title)
+        record.description = _intern(description)
+        record.start_tz = _timezone_for(timedelta(seconds=start_offset) if start_offset is not None else None)
+        record.end_tz = _timezone_for(timedelta(seconds=end_offset) if end_offset is not None else None)
+        record.cost = _intern(cost)
+        record.location = _intern(location)
+        record.provider_id = _intern(provider_id)
+        record.source_url = _intern(source_url)
+        record.region = _intern(region)
+        return record
+
+    def to_row(self) -> tuple:
+        """
+        Plain-value tuple in __slots__ order (time zones as UTC offset seconds), for persisting.
+        """
+        return tuple(
+            value.utcoffset(None) // _SECOND if isinstance(value, timezone) else value
+            for value in self._values()
+        )
+
+    @property
+    def start_date(self) -> datetime:
+        return (_EPOCH + timedelta(seconds=self.start)).replace(tzinfo=self.start_tz)
+
+    @property
+    def end_date(self) -> Optional[datetime]:
+        if self.end is None:
+            return None
+        return (_EPOCH + timedelta(seconds=self.end)).replace(tzinfo=self.end_tz)
+
+    def to_dict(self) -> dict:
+        """
+        Event fields as plain values; JSON_ADAPTER serializes them exactly like the Event model.
+        """
+        return {name: getattr(self, name) for name in EVENT_FIELDS}
+
+    def to_event(self) -> Event:
+        return Event.model_validate(self.to_dict())
+
+    def _values(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, EventRecord):
+            return NotImplemented
+        return self._values() == other._values()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"EventRecord(id={self.id!r}, title={self.title!r}, start_date={self.start_date.isoformat()})"
+
 class ProviderConfig(BaseModel):
+    # Configs are shared between the scheduler and API requests, so they are immutable
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: Optional[str] = None
     enabled: bool
     module: str
-    update_interval: str  # e.g. "24h"
+    update_interval: Optional[str] = None  # e.g. "24h", falls back to global.default_update_interval
     region: Optional[str] = None
     params: Optional[dict] = {}
     address: Optional[str] = None
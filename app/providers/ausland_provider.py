@@ -1,10 +1,10 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List, Optional
 import re
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -13,15 +13,19 @@ logger = logging.getLogger(__name__)
 class AuslandProvider(EventProvider):
     URL = "https://ausland.berlin/program/all"
 
-    def fetch_events(self) -> List[Event]:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
 
             event_items = soup.select('.event')
             
@@ -124,7 +128,7 @@ class AuslandProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching events for Ausland: {e}")
+            logger.error(f"Error parsing events for Ausland: {e}")
             return []
 
         return events
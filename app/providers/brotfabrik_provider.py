@@ -1,29 +1,31 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List, Optional
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
+from app.providers.parsing import parse_html, strain
 
 logger = logging.getLogger(__name__)
 
 class BrotfabrikProvider(EventProvider):
     URL = "https://brotfabrik-berlin.de/buehne/"
 
+    # User-Agent might be needed to avoid 403
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> str:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.text
+
+    def parse_events(self, raw: str) -> List[Event]:
         events = []
         try:
-            # User-Agent might be needed to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = parse_html(raw, only=strain('div', 'tribe-events-calendar-list__event-row'))
             
             # Find all event rows
             # The structure has nested articles/divs. 
@@ -117,6 +119,6 @@ class BrotfabrikProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching brotfabrik events: {e}")
+            logger.error(f"Error parsing brotfabrik events: {e}")
             
         return events
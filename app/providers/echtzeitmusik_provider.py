@@ -1,9 +1,9 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List, Optional
 
+from app.http_client import AsyncHttpClient, apparent_encoding
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -12,16 +12,18 @@ logger = logging.getLogger(__name__)
 class EchtzeitmusikProvider(EventProvider):
     URL = "https://www.echtzeitmusik.de/index.php?page=calendar"
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> str:
+        response = await client.get(self.URL)
+        response.raise_for_status()
+
+        # The site uses latin-1 or similar often, but let's check encoding or let BS handle it
+        response.encoding = apparent_encoding(response.content)
+        return response.text
+
+    def parse_events(self, raw: str) -> List[Event]:
         events = []
         try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            
-            # The site uses latin-1 or similar often, but let's check encoding or let BS handle it
-            response.encoding = response.apparent_encoding
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
             
             # The layout is table-based. We need to iterate through rows.
             # Strategy: Find all rows, iterate and maintain state.
@@ -124,6 +126,6 @@ class EchtzeitmusikProvider(EventProvider):
                 events.append(event)
                 
         except Exception as e:
-            logger.error(f"Error fetching echtzeitmusik events: {e}")
+            logger.error(f"Error parsing echtzeitmusik events: {e}")
             
         return events
@@ -1,5 +1,5 @@
 from typing import List
-from datetime import datetime
+from app import clock
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -10,7 +10,7 @@ class ExampleProvider(EventProvider):
                 id="1",
                 title="Example Event 1",
                 description="This is a test event.",
-                start_date=datetime.now(),
+                start_date=clock.now(),
                 provider_id="example_provider",
                 source_url="http://example.com/event1",
                 cost="Free",
@@ -20,7 +20,7 @@ class ExampleProvider(EventProvider):
                 id="2",
                 title="Example Event 2",
                 description="Another test event.",
-                start_date=datetime.now(),
+                start_date=clock.now(),
                 provider_id="example_provider",
                 source_url="http://example.com/event2",
                 cost="10 EUR",
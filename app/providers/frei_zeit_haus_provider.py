@@ -1,12 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List
 import re
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
+from app.providers.parsing import iter_elements
 
 logger = logging.getLogger(__name__)
 
@@ -23,20 +23,24 @@ class FreiZeitHausProvider(EventProvider):
         "Okt.": 10, "Nov.": 11, "Dez.": 12, "Dezember": 12, "Oktober": 10
     }
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             events = []
             
-            # Select event containers
+            # Stream event containers
             # Look for divs that contain both date and text parts
-            containers = soup.select('div.col-xs-12.abstand-all-null.schatten')
+            containers = iter_elements(raw, 'div', 'schatten')
             
             for container in containers:
                 try:
+                    if not {'col-xs-12', 'abstand-all-null'} <= set(container.get('class', [])):
+                        continue
+
                     date_div = container.select_one('.neulandeventDate')
                     if not date_div:
                         continue
@@ -103,5 +107,5 @@ class FreiZeitHausProvider(EventProvider):
             return events
 
         except Exception as e:
-            logger.error(f"Error fetching events from Frei-Zeit-Haus: {e}")
+            logger.error(f"Error parsing events from Frei-Zeit-Haus: {e}")
             return []
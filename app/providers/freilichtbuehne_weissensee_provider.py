@@ -1,10 +1,11 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List, Optional
 import re
 
+from app import clock
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -13,16 +14,20 @@ logger = logging.getLogger(__name__)
 class FreilichtbuehneWeissenseeProvider(EventProvider):
     URL = "https://freilichtbuehne-weissensee.de"
 
-    def fetch_events(self) -> List[Event]:
+    # Fake User-Agent to avoid 403
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            # Fake User-Agent to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
 
             # Events are in a table row with class 'event-date' inside a td
             # Let's select all trs that have a .event-date
@@ -71,7 +76,7 @@ class FreilichtbuehneWeissenseeProvider(EventProvider):
                         month = int(d_match.group(2))
                         
                         # Year logic
-                        now = datetime.now()
+                        now = clock.now()
                         year = now.year
                         # If event is earlier in year (e.g. Feb) and we are in Dec, it's next year
                         if now.month > 10 and month < 3:
@@ -122,7 +127,7 @@ class FreilichtbuehneWeissenseeProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching events for Freilichtbuehne Weissensee: {e}")
+            logger.error(f"Error parsing events for Freilichtbuehne Weissensee: {e}")
             return []
 
         return events
@@ -1,28 +1,32 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List, Optional
 import re
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
+from app.providers.parsing import parse_html, strain
 
 logger = logging.getLogger(__name__)
 
 class GruenePankowProvider(EventProvider):
     URL = "https://gruene-pankow.de/termine/"
 
-    def fetch_events(self) -> List[Event]:
+    # Fake User-Agent to avoid 403
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            # Fake User-Agent to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(raw, only=strain('div', 'tribe-events-calendar-list__event-row'))
 
             # Standard 'The Events Calendar' list view
             event_rows = soup.select('.tribe-events-calendar-list__event-row')
@@ -116,7 +120,7 @@ class GruenePankowProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching events for Gruene Pankow: {e}")
+            logger.error(f"Error parsing events for Gruene Pankow: {e}")
             return []
 
         return events
@@ -1,12 +1,51 @@
-from abc import ABC, abstractmethod
-from typing import List
+import asyncio
+from abc import ABC
+from typing import Any, List
+from ..http_client import AsyncHttpClient
 from ..models import Event
 
 class EventProvider(ABC):
-    @abstractmethod
+    """
+    Providers implement the two-step pipeline from the specification:
+    fetch_source() downloads the raw content through the shared async HTTP client and
+    parse_events() turns it into Event objects without doing any I/O.
+
+    Providers that only override fetch_events() keep working; the orchestrator runs
+    them in a worker thread instead of on the shared event loop.
+    """
+
+    async def fetch_source(self, client: AsyncHttpClient) -> Any:
+        """
+        Downloads the provider's raw content (HTML, JSON, ...) using the given client.
+        """
+        raise NotImplementedError
+
+    def parse_events(self, raw: Any) -> List[Event]:
+        """
+        Parses the raw content returned by fetch_source() into Event objects.
+        """
+        raise NotImplementedError
+
     def fetch_events(self) -> List[Event]:
         """
         Fetches events from the provider's source.
         Returns a list of Event objects.
         """
-        pass
+        async def fetch() -> Any:
+            async with AsyncHttpClient() as client:
+                return await self.fetch_source(client)
+
+        return self.parse_events(asyncio.run(fetch()))
+
+    @classmethod
+    def supports_async_fetch(cls) -> bool:
+        return cls.fetch_source is not EventProvider.fetch_source
+
+    @classmethod
+    def is_implemented(cls) -> bool:
+        """
+        True if the provider overrides fetch_events() or both fetch_source() and parse_events().
+        """
+        if cls.fetch_events is not EventProvider.fetch_events:
+            return True
+        return cls.supports_async_fetch() and cls.parse_events is not EventProvider.parse_events
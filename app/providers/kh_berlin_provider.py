@@ -1,10 +1,10 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 import re
 from typing import List
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -13,12 +13,15 @@ logger = logging.getLogger(__name__)
 class KHBerlinProvider(EventProvider):
     URL = "https://kh-berlin.de/kalender"
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
 
             event_list = soup.find('ul', class_='events')
             if not event_list:
@@ -98,6 +101,6 @@ class KHBerlinProvider(EventProvider):
                     continue
                     
         except Exception as e:
-            logger.error(f"Error fetching KH Berlin events: {e}")
+            logger.error(f"Error parsing KH Berlin events: {e}")
             
         return events
@@ -1,27 +1,32 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List, Optional
 import re
 
+from app import clock
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
+from app.providers.parsing import parse_html, strain
 
 logger = logging.getLogger(__name__)
 
 class KinoKrokodilProvider(EventProvider):
     URL = "https://kino-krokodil.de/programm/"
 
-    def fetch_events(self) -> List[Event]:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(raw, only=strain(class_='film'))
 
             film_rows = soup.select('.film')
             
@@ -79,7 +84,7 @@ class KinoKrokodilProvider(EventProvider):
                             time_str = t_match.group(1)
                             
                             # Determine year
-                            now = datetime.now()
+                            now = clock.now()
                             year = now.year
                             # Heuristic: if month is much less than current month, maybe next year?
                             # But usually program is current or near future.
@@ -127,7 +132,7 @@ class KinoKrokodilProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching events for Kino Krokodil: {e}")
+            logger.error(f"Error parsing events for Kino Krokodil: {e}")
             return []
 
         return events
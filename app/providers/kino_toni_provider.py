@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
@@ -6,6 +5,7 @@ import re
 from typing import List
 from urllib.parse import urlparse
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -14,12 +14,15 @@ logger = logging.getLogger(__name__)
 class KinoToniProvider(EventProvider):
     URL = "https://kino-toni.de"
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
 
             # Find all date headers
             date_headers = soup.find_all('h3', class_='program_date1')
@@ -86,6 +89,6 @@ class KinoToniProvider(EventProvider):
                             region="berlin" 
                         ))
         except Exception as e:
-            logger.error(f"Error fetching Kino Toni events: {e}")
+            logger.error(f"Error parsing Kino Toni events: {e}")
             
         return events
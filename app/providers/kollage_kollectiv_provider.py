@@ -1,10 +1,16 @@
+import asyncio
 import re
-import requests
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from app import clock
 from app.providers.interface import EventProvider
+from app.asset_cache import AssetCache
+from app.http_client import AsyncHttpClient
 from app.models import Event
 
+# Events extracted from each content-hashed bundle, shared across cycles and restarts
+ASSETS = AssetCache()
+
 class KollageKollectivProvider(EventProvider):
     BASE_URL = "https://kollagekollectiv.com"
     LATITUDE = 52.5358
@@ -17,43 +23,65 @@ class KollageKollectivProvider(EventProvider):
         "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12
     }
 
-    def fetch_events(self) -> List[Event]:
+    # Bump when EVENT_PATTERN or _extract_matches change, so cached bundles are re-scanned
+    EXTRACTION_VERSION = 1
+
+    EVENT_PATTERN = re.compile(
+        r'children:"(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC|EVERY)",?.*?children:"(\d+|WED|MON|TUE|THU|FRI|SAT|SUN)",?.*?h3.*?children:"(.*?)"', 
+        re.DOTALL
+    )
+    TIME_PATTERN = re.compile(r'children:"(\d{1,2}:\d{2}(?:\s*-\s*\d{1,2}:\d{2})?)"')
+
+    async def fetch_source(self, client: AsyncHttpClient) -> List[Tuple[str, str, str, Optional[str]]]:
+        # Step 1: Fetch the main page to find the JS bundle
+        response = await client.get(self.BASE_URL)
+        response.raise_for_status()
+        html_content = response.text
+
+        # Find the JS file path
+        # <script type="module" crossorigin src="/assets/index-Db8MTPiW.js"></script>
+        js_match = re.search(r'src="(/assets/index-[^"]+\.js)"', html_content)
+        if not js_match:
+            raise ValueError(f"Could not find JS bundle in {self.BASE_URL}")
+
+        js_url = self.BASE_URL + js_match.group(1)
+
+        # The bundle name contains its content hash, an unchanged name means unchanged events
+        cache_key = f"kollage_kollectiv:v{self.EXTRACTION_VERSION}:{js_url}"
+        cached = ASSETS.get(cache_key)
+        if cached is not None:
+            return [tuple(match) for match in cached]
+
+        # Step 2: Fetch the JS bundle
+        js_response = await client.get(js_url)
+        js_response.raise_for_status()
+
+        # Step 3: Extract the raw event fields, scanning the ~1 MB bundle off the event loop
+        loop = asyncio.get_running_loop()
+        matches = await loop.run_in_executor(None, self._extract_matches, js_response.text)
+        ASSETS.put(cache_key, matches)
+        return matches
+
+    def _extract_matches(self, js_content: str) -> List[Tuple[str, str, str, Optional[str]]]:
+        """
+        Returns (month, day, title, time) for every event card in the bundle.
+        """
+        matches = []
+        for match in self.EVENT_PATTERN.finditer(js_content):
+            month_str, day_str, title = match.groups()
+
+            end_pos = match.end()
+            remaining = js_content[end_pos:end_pos+300]
+            time_match = self.TIME_PATTERN.search(remaining)
+            time_str = time_match.group(1) if time_match else None
+
+            matches.append((month_str, day_str, title, time_str))
+        return matches
+
+    def parse_events(self, raw: List[Tuple[str, str, str, Optional[str]]]) -> List[Event]:
         events = []
         try:
-            # Step 1: Fetch the main page to find the JS bundle
-            response = requests.get(self.BASE_URL)
-            response.raise_for_status()
-            html_content = response.text
-
-            # Find the JS file path
-            # <script type="module" crossorigin src="/assets/index-Db8MTPiW.js"></script>
-            js_match = re.search(r'src="(/assets/index-[^"]+\.js)"', html_content)
-            if not js_match:
-                print(f"Could not find JS bundle in {self.BASE_URL}")
-                return []
-
-            js_url = self.BASE_URL + js_match.group(1)
-            
-            # Step 2: Fetch the JS bundle
-            js_response = requests.get(js_url)
-            js_response.raise_for_status()
-            js_content = js_response.text
-
-            # Step 3: Extract events using regex
-            pattern = re.compile(
-                r'children:"(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC|EVERY)",?.*?children:"(\d+|WED|MON|TUE|THU|FRI|SAT|SUN)",?.*?h3.*?children:"(.*?)"', 
-                re.DOTALL
-            )
-            
-            matches = list(pattern.finditer(js_content))
-            
-            for match in matches:
-                month_str, day_str, title = match.groups()
-                
-                end_pos = match.end()
-                remaining = js_content[end_pos:end_pos+300]
-                time_match = re.search(r'children:"(\d{1,2}:\d{2}(?:\s*-\s*\d{1,2}:\d{2})?)"', remaining)
-                time_str = time_match.group(1) if time_match else None
+            for month_str, day_str, title, time_str in raw:
                 
                 event_date = None
                 description = None
@@ -61,12 +89,12 @@ class KollageKollectivProvider(EventProvider):
                 if month_str == "EVERY":
                     day_map = {"MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4, "SAT": 5, "SUN": 6}
                     if day_str in day_map:
-                        current_weekday = datetime.now().weekday()
+                        current_weekday = clock.now().weekday()
                         target_weekday = day_map[day_str]
                         days_diff = (target_weekday - current_weekday)
                         if days_diff < 0:
                             days_diff += 7
-                        event_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+                        event_date = clock.now().replace(hour=0, minute=0, second=0, microsecond=0)
                         from datetime import timedelta
                         event_date += timedelta(days=days_diff)
                         description = f"Every {day_str}"
@@ -75,7 +103,7 @@ class KollageKollectivProvider(EventProvider):
                     month = self.MONTH_MAP.get(month_str)
                     if month and day_str.isdigit():
                         day = int(day_str)
-                        now = datetime.now()
+                        now = clock.now()
                         year = now.year
                         
                         test_date = datetime(year, month, day)
@@ -109,6 +137,6 @@ class KollageKollectivProvider(EventProvider):
                         address=self.ADDRESS
                     ))
         except Exception as e:
-            print(f"Error fetching Kollage Kollectiv events: {e}")
+            print(f"Error parsing Kollage Kollectiv events: {e}")
         
         return events
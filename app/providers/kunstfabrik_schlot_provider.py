@@ -1,101 +1,125 @@
-import requests
+import asyncio
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 import re
-import time
 
+from app import clock
+from app.enrichment import DetailPageEnricher
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
 logger = logging.getLogger(__name__)
 
+# Detail pages are cached per URL across cycles (the loaded provider module is reused)
+DETAIL_PAGES = DetailPageEnricher(ttl=24 * 60 * 60, concurrency=4)
+
 class KunstfabrikSchlotProvider(EventProvider):
     URL = "https://kunstfabrik-schlot.de/programm/"
 
-    def fetch_events(self) -> List[Event]:
+    # Fake User-Agent to avoid 403
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
+
+    # Map German months
+    MONTH_MAP = {
+        'Jan': 1, 'Feb': 2, 'Mär': 3, 'Apr': 4, 'Mai': 5, 'Jun': 6,
+        'Jul': 7, 'Aug': 8, 'Sep': 9, 'Okt': 10, 'Nov': 11, 'Dez': 12
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> Tuple[List[Tuple[str, str, int, int]], Dict[str, Optional[str]]]:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+
+        # The list only has dates, the start time is on each event's detail page.
+        # The listing is parsed only here; parse_events works on the extracted items.
+        loop = asyncio.get_running_loop()
+        items = await loop.run_in_executor(None, self._parse_list_items, response.content)
+        detail_urls = [item[0] for item in items]
+        start_times = await DETAIL_PAGES.fetch(
+            client, detail_urls, self._extract_start_time, headers=self.HEADERS, timeout=5
+        )
+        return items, start_times
+
+    def _parse_list_items(self, listing: bytes) -> List[Tuple[str, str, int, int]]:
+        """
+        Returns (source_url, title, day, month) for every usable list item.
+        """
+        items = []
+        soup = BeautifulSoup(listing, 'html.parser')
+
+        for item in soup.select('.edgtf-el-item'):
+            try:
+                # Link
+                link_tag = item.select_one('.edgtf-el-item-link-outer')
+                if not link_tag:
+                     continue
+                source_url = link_tag['href']
+                
+                # Title
+                title_tag = item.select_one('.edgtf-el-item-title')
+                if not title_tag:
+                     continue
+                title = title_tag.get_text(strip=True)
+                
+                if "geschlossen" in title.lower():
+                    continue
+
+                # Date
+                # .edgtf-el-item-day -> "04"
+                # .edgtf-el-item-month -> "Feb"
+                day_tag = item.select_one('.edgtf-el-item-day')
+                month_tag = item.select_one('.edgtf-el-item-month')
+                
+                if not (day_tag and month_tag):
+                    continue
+                    
+                day = int(day_tag.get_text(strip=True))
+                month_str = month_tag.get_text(strip=True)
+                month = self.MONTH_MAP.get(month_str, 0)
+                
+                if month == 0:
+                    continue
+
+                items.append((source_url, title, day, month))
+
+            except Exception as e:
+                logger.error(f"Error parsing schlot item: {e}")
+                continue
+
+        return items
+
+    @staticmethod
+    def _extract_start_time(content: bytes) -> Optional[str]:
+        detail_soup = BeautifulSoup(content, 'html.parser')
+        # Look for 21:00 Uhr in .offbeat-event-info-item-desc
+        desc_spans = detail_soup.select('.offbeat-event-info-item-desc')
+        for span in desc_spans:
+            text = span.get_text(strip=True)
+            t_match = re.search(r'(\d{2}:\d{2})', text)
+            if t_match:
+                return t_match.group(1)
+        return None
+
+    def parse_events(self, raw: Tuple[List[Tuple[str, str, int, int]], Dict[str, Optional[str]]]) -> List[Event]:
         events = []
         try:
-            # Fake User-Agent to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            session = requests.Session()
-            session.headers.update(headers)
-            
-            response = session.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # List items
-            items = soup.select('.edgtf-el-item')
-            
-            # Map German months
-            month_map = {
-                'Jan': 1, 'Feb': 2, 'Mär': 3, 'Apr': 4, 'Mai': 5, 'Jun': 6,
-                'Jul': 7, 'Aug': 8, 'Sep': 9, 'Okt': 10, 'Nov': 11, 'Dez': 12
-            }
-
-            for item in items:
-                try:
-                    # Link
-                    link_tag = item.select_one('.edgtf-el-item-link-outer')
-                    if not link_tag:
-                         continue
-                    source_url = link_tag['href']
-                    
-                    # Title
-                    title_tag = item.select_one('.edgtf-el-item-title')
-                    if not title_tag:
-                         continue
-                    title = title_tag.get_text(strip=True)
-                    
-                    if "geschlossen" in title.lower():
-                        continue
+            items, start_times = raw
 
-                    # Date
-                    # .edgtf-el-item-day -> "04"
-                    # .edgtf-el-item-month -> "Feb"
-                    day_tag = item.select_one('.edgtf-el-item-day')
-                    month_tag = item.select_one('.edgtf-el-item-month')
-                    
-                    if not (day_tag and month_tag):
-                        continue
-                        
-                    day = int(day_tag.get_text(strip=True))
-                    month_str = month_tag.get_text(strip=True)
-                    month = month_map.get(month_str, 0)
-                    
-                    if month == 0:
-                        continue
-                        
+            for source_url, title, day, month in items:
+                try:
                     # Year logic
-                    now = datetime.now()
+                    now = clock.now()
                     year = now.year
                     if now.month > 10 and month < 3:
                         year += 1
                         
-                    # Fetch detail for Time
+                    # Time from the detail page
                     # Default 21:00 if fetch fails or parsing fails
-                    time_str = "21:00" 
-                    
-                    try:
-                        # Sleep briefly to avoid hammering
-                        # time.sleep(0.1) 
-                        detail_resp = session.get(source_url, timeout=5)
-                        if detail_resp.status_code == 200:
-                            detail_soup = BeautifulSoup(detail_resp.content, 'html.parser')
-                            # Look for 21:00 Uhr in .offbeat-event-info-item-desc
-                            desc_spans = detail_soup.select('.offbeat-event-info-item-desc')
-                            for span in desc_spans:
-                                text = span.get_text(strip=True)
-                                t_match = re.search(r'(\d{2}:\d{2})', text)
-                                if t_match:
-                                    time_str = t_match.group(1)
-                                    break
-                    except Exception as e:
-                        logger.warning(f"Could not fetch/parse detail for {title}: {e}")
+                    time_str = start_times.get(source_url) or "21:00"
 
                     dt_str = f"{year}-{month:02d}-{day:02d}T{time_str}:00"
                     
@@ -135,7 +159,7 @@ class KunstfabrikSchlotProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching events for Kunstfabrik Schlot: {e}")
+            logger.error(f"Error parsing events for Kunstfabrik Schlot: {e}")
             return []
 
         return events
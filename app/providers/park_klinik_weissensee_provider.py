@@ -1,12 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List
 import re
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
+from app.providers.parsing import iter_elements
 
 logger = logging.getLogger(__name__)
 
@@ -14,16 +14,17 @@ class ParkKlinikWeissenseeProvider(EventProvider):
     URL = "https://www.parkkliniken-weissensee.de/de/Aktuelles/Veranstaltungen/Veranstaltungsliste.php?c=&l=Park-Klinik+Weißensee"
     BASE_URL = "https://www.parkkliniken-weissensee.de"
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             events = []
             
-            # Select all event containers
-            event_containers = soup.select('div.pkb-veranstaltung')
+            # Stream the event containers, the rest of the page is not needed
+            event_containers = iter_elements(raw, 'div', 'pkb-veranstaltung')
             
             for container in event_containers:
                 try:
@@ -92,5 +93,5 @@ class ParkKlinikWeissenseeProvider(EventProvider):
             return events
 
         except Exception as e:
-            logger.error(f"Error fetching events from Park-Klinik Weißensee: {e}")
+            logger.error(f"Error parsing events from Park-Klinik Weißensee: {e}")
             return []
@@ -0,0 +1,113 @@
+"""
+Shared HTML parsing helpers for providers.
+
+Providers usually only need a small part of a page (the event rows). Instead of building
+a full html.parser tree and select()ing from it, they can:
+
+- parse_html(raw, only=strain("div", "event-row")): build a BeautifulSoup tree that only
+  contains the matching elements, using the fastest installed backend (lxml if available).
+- iter_elements(raw, "div", "event-row"): stream the page and yield each matching element
+  as soon as it is complete, releasing everything already processed. Peak memory then
+  depends on the size of one event instead of the whole page.
+
+Both return regular BeautifulSoup tags, so the extraction code of a provider stays the same.
+"""
+import logging
+from itertools import chain
+from typing import Iterator, Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4.dammit import UnicodeDammit
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is optional
+    etree = None
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSER = "lxml" if etree is not None else "html.parser"
+
+# Bytes fed to the streaming parser at once
+STREAM_CHUNK_SIZE = 64 * 1024
+
+Markup = Union[str, bytes]
+
+
+def strain(name: Optional[str] = None, class_: Optional[str] = None) -> SoupStrainer:
+    """
+    Builds a SoupStrainer for `name` elements with the CSS class `class_`.
+    While parsing, the class attribute is still a single string ("row pkb-veranstaltung"),
+    so a plain SoupStrainer(class_=...) would only match elements with exactly that one class.
+    """
+    if class_ is None:
+        return SoupStrainer(name)
+    return SoupStrainer(name, class_=lambda value: value is not None and _has_class_token(value, class_))
+
+
+def parse_html(markup: Markup, only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parses a page with the fastest available backend.
+    If `only` is given, just the matching elements (and their contents) are kept.
+    """
+    return BeautifulSoup(markup, HTML_PARSER, parse_only=only)
+
+
+def _to_text(markup: Markup) -> str:
+    if isinstance(markup, bytes):
+        # Same encoding detection BeautifulSoup uses (BOM, <meta charset>, guessing)
+        return UnicodeDammit(markup, is_html=True).unicode_markup or ""
+    return markup
+
+
+def _has_class_token(value, class_: str) -> bool:
+    tokens = value.split() if isinstance(value, str) else value
+    return class_ in tokens
+
+
+def _has_class(element, class_: Optional[str]) -> bool:
+    return class_ is None or _has_class_token(element.get("class") or "", class_)
+
+
+def iter_elements(markup: Markup, name: str, class_: Optional[str] = None) -> Iterator[Tag]:
+    """
+    Yields every outermost `name` element (with CSS class `class_`, if given) of a page.
+    Nested matches are part of their outer element and not yielded separately.
+
+    With lxml the page is parsed incrementally and each element is handed out as soon
+    as its end tag was seen; without lxml this falls back to a strained parse_html().
+    """
+    if etree is None:
+        soup = parse_html(markup, strain(name, class_))
+        yield from soup.find_all(name, class_=class_, recursive=False)
+        return
+
+    text = _to_text(markup)
+    parser = etree.HTMLPullParser(events=("start", "end"))
+    active = None
+
+    chunks = (text[offset:offset + STREAM_CHUNK_SIZE] for offset in range(0, len(text), STREAM_CHUNK_SIZE))
+    for chunk in chain(chunks, [None]):
+        if chunk is None:
+            # Closes unterminated elements at the end of the page
+            parser.close()
+        else:
+            parser.feed(chunk)
+
+        for event, element in parser.read_events():
+            if event == "start":
+                if active is None and element.tag == name and _has_class(element, class_):
+                    active = element
+                continue
+
+            if element is active:
+                fragment = etree.tostring(element, encoding="unicode", method="html", with_tail=False)
+                yield BeautifulSoup(fragment, HTML_PARSER).find(name)
+                active = None
+            elif active is not None:
+                continue
+
+            # Everything up to here has been handed out, free it
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
@@ -1,10 +1,11 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List, Optional
 import re
 
+from app import clock
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -15,18 +16,20 @@ class PartyInPankowProvider(EventProvider):
     URL = "http://www.rockradio.de/rr_termine_speiche_werbung_termine_raumerstr.php"
     BASE_URL = "http://www.rockradio.de/"
 
-    def fetch_events(self) -> List[Event]:
+    # Fake User-Agent to avoid 403
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        # The raw bytes are handed to BeautifulSoup, which detects the encoding itself
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            # Fake User-Agent to avoid 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            # encoding fix
-            response.encoding = response.apparent_encoding
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
             
             rows = soup.find_all('tr')
             
@@ -54,7 +57,7 @@ class PartyInPankowProvider(EventProvider):
                         time_str = f"{t_match.group(1)}:{t_match.group(2)}"
                         
                     # Year logic
-                    now = datetime.now()
+                    now = clock.now()
                     year = now.year
                     if now.month > 10 and month < 3:
                         year += 1
@@ -118,7 +121,7 @@ class PartyInPankowProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching events for Party in Pankow: {e}")
+            logger.error(f"Error parsing events for Party in Pankow: {e}")
             return []
 
         return events
@@ -1,10 +1,11 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 import re
 from typing import List
 
+from app import clock
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -13,12 +14,15 @@ logger = logging.getLogger(__name__)
 class PeterEdelProvider(EventProvider):
     URL = "https://www.peteredel.de/events/"
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
             
             # Find relevant tags in order: Month Headers and Event Boxes
             # Month Header: <h1> containing Year (e.g., "JANUAR 2026")
@@ -29,7 +33,7 @@ class PeterEdelProvider(EventProvider):
                 (tag.name == 'div' and 'box-rc-dark-grey' in tag.get('class', []))
             )
 
-            current_year = datetime.now().year
+            current_year = clock.now().year
             
             for tag in tags:
                 if tag.name == 'h1':
@@ -130,6 +134,6 @@ class PeterEdelProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching Peter Edel events: {e}")
+            logger.error(f"Error parsing Peter Edel events: {e}")
             
         return events
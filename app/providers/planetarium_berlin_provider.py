@@ -1,7 +1,8 @@
-import requests
+import json
 import logging
 from typing import List, Optional
 from datetime import datetime
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -19,15 +20,19 @@ class PlanetariumBerlinProvider(EventProvider):
         "Wilhelm-Foerster-Sternwarte": "Munsterdamm 90, 12169 Berlin"
     }
 
-    def fetch_events(self) -> List[Event]:
+    HEADERS = {
+        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.API_URL, headers=self.HEADERS, timeout=30)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            }
-            response = requests.get(self.API_URL, headers=headers, timeout=30)
-            response.raise_for_status()
-            data = response.json()
+            data = json.loads(raw)
 
             for item in data:
                 try:
@@ -78,6 +83,6 @@ class PlanetariumBerlinProvider(EventProvider):
                     continue
 
         except Exception as e:
-            logger.error(f"Error fetching Planetarium Berlin events: {e}")
+            logger.error(f"Error parsing Planetarium Berlin events: {e}")
 
         return events
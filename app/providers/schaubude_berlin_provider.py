@@ -1,26 +1,30 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 from typing import List
 import re
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
+from app.providers.parsing import parse_html, strain
 
 logger = logging.getLogger(__name__)
 
 class SchaubudeBerlinProvider(EventProvider):
     URL = "https://schaubude.berlin/de/spielplan/2026/03?view=list"
     
-    def fetch_events(self) -> List[Event]:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(raw, only=strain('section'))
             
             events = []
             
@@ -93,5 +97,5 @@ class SchaubudeBerlinProvider(EventProvider):
             return events
 
         except Exception as e:
-            logger.error(f"Error fetching events from Schaubude Berlin: {e}")
+            logger.error(f"Error parsing events from Schaubude Berlin: {e}")
             return []
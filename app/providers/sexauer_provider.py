@@ -1,12 +1,12 @@
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
 import re
 from typing import List
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
+from app.providers.parsing import parse_html, strain
 
 logger = logging.getLogger(__name__)
 
@@ -28,12 +28,15 @@ class SexauerProvider(EventProvider):
         "december": 12, "dezember": 12
     }
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            response = requests.get(self.URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = parse_html(raw, only=strain('article'))
 
             articles = soup.find_all('article')
             for article in articles:
@@ -98,6 +101,6 @@ class SexauerProvider(EventProvider):
                             region="berlin"
                         ))
         except Exception as e:
-            logger.error(f"Error fetching Sexauer events: {e}")
+            logger.error(f"Error parsing Sexauer events: {e}")
             
         return events
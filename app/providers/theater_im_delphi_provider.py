@@ -1,4 +1,3 @@
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import logging
@@ -6,6 +5,7 @@ import re
 from typing import List
 from urllib.parse import urljoin
 
+from app.http_client import AsyncHttpClient
 from app.models import Event
 from app.providers.interface import EventProvider
 
@@ -14,15 +14,19 @@ logger = logging.getLogger(__name__)
 class TheaterImDelphiProvider(EventProvider):
     URL = "https://theater-im-delphi.de/programm/"
 
-    def fetch_events(self) -> List[Event]:
+    HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+    }
+
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.URL, headers=self.HEADERS)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
-            }
-            response = requests.get(self.URL, headers=headers)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
 
             # German month mapping
             month_map = {
@@ -141,6 +145,6 @@ class TheaterImDelphiProvider(EventProvider):
                         continue
 
         except Exception as e:
-            logger.error(f"Error fetching events from {self.URL}: {e}")
+            logger.error(f"Error parsing events from {self.URL}: {e}")
         
         return events
@@ -1,9 +1,9 @@
 import re
-import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import List, Optional
 from app.providers.interface import EventProvider
+from app.http_client import AsyncHttpClient
 from app.models import Event
 
 class ZirkusMondProvider(EventProvider):
@@ -14,12 +14,15 @@ class ZirkusMondProvider(EventProvider):
     LOCATION_NAME = "Zirkus Mond"
     ADDRESS = "Lilli-Henoch-Straße, 10405 Berlin"
 
-    def fetch_events(self) -> List[Event]:
+    async def fetch_source(self, client: AsyncHttpClient) -> bytes:
+        response = await client.get(self.BASE_URL)
+        response.raise_for_status()
+        return response.content
+
+    def parse_events(self, raw: bytes) -> List[Event]:
         events = []
         try:
-            response = requests.get(self.BASE_URL)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(raw, 'html.parser')
 
             # Find the container with events
             # <div class="zm-container flex all-events mt-14 flex-wrap">
@@ -93,6 +96,6 @@ class ZirkusMondProvider(EventProvider):
                     ))
 
         except Exception as e:
-            print(f"Error fetching Zirkus Mond events: {e}")
+            print(f"Error parsing Zirkus Mond events: {e}")
         
         return events
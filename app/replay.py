@@ -0,0 +1,238 @@
+import base64
+import gzip
+import json
+import logging
+import os
+import threading
+from collections import namedtuple
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+from . import clock
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MODE_ENV = "HTTP_REPLAY_MODE"
+REPLAY_ARCHIVE_ENV = "HTTP_REPLAY_ARCHIVE"
+REPLAY_RECORD_CYCLES_ENV = "HTTP_REPLAY_RECORD_CYCLES"
+DEFAULT_ARCHIVE_FILE = "http_archive.json.gz"
+# Update cycles recorded before the archive is closed (0: record until shutdown)
+DEFAULT_RECORD_CYCLES = 1
+
+MODE_RECORD = "record"
+MODE_REPLAY = "replay"
+
+ARCHIVE_VERSION = 1
+# Response headers worth keeping; the body is stored decoded, so encoding/length are dropped
+RECORDED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+ReplayedLocation = namedtuple("ReplayedLocation", ["latitude", "longitude"])
+
+
+class HttpArchive:
+    """
+    Compact on-disk record of one or more update cycles: every HTTP response (provider
+    pages, detail pages) keyed by method and URL, every geocoder answer keyed by query,
+    and the time the recording started.
+
+    Responses for the same URL are replayed in recording order; once they are used up
+    the last one is repeated. Requests that were never recorded fail like an unreachable
+    host, so a replay never touches the network.
+
+    A recording is closed after `record_cycles` update cycles (0: never); later requests
+    still go to the network but are no longer added.
+    """
+
+    def __init__(self, path: str, mode: str, record_cycles: int = DEFAULT_RECORD_CYCLES):
+        self.path = path
+        self.mode = mode
+        self.record_cycles = record_cycles
+        self.cycles_recorded = 0
+        self._lock = threading.Lock()
+        self._http: Dict[str, List[dict]] = {}
+        self._geocode: Dict[str, Optional[List[float]]] = {}
+        self._replay_positions: Dict[str, int] = {}
+        # Records not written to disk yet; processes that never recorded never save
+        self._unsaved = False
+        self.recorded_at = clock.now()
+        if mode == MODE_REPLAY:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == MODE_RECORD
+
+    @property
+    def closed(self) -> bool:
+        return 0 < self.record_cycles <= self.cycles_recorded
+
+    def _load(self):
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported archive version in {self.path}: {data.get('version')!r}")
+        self.recorded_at = datetime.fromisoformat(data["recorded_at"])
+        self._http = data.get("http", {})
+        self._geocode = data.get("geocode", {})
+        logger.info(
+            f"Replaying {sum(len(r) for r in self._http.values())} responses and "
+            f"{len(self._geocode)} geocoder answers recorded at {self.recorded_at.isoformat()}."
+        )
+
+    def finish_cycle(self):
+        """
+        Called after each update cycle: saves what was recorded and closes the
+        recording once `record_cycles` cycles are complete.
+        """
+        if not self.recording or self.closed:
+            return
+        self.cycles_recorded += 1
+        self.save()
+        if self.closed:
+            logger.info(f"Recorded {self.cycles_recorded} update cycles to {self.path}, recording stopped.")
+
+    def save(self):
+        if not self.recording:
+            return
+        with self._lock:
+            if not self._unsaved:
+                return
+            data = {
+                "version": ARCHIVE_VERSION,
+                "recorded_at": self.recorded_at.isoformat(),
+                "http": self._http,
+                "geocode": self._geocode,
+            }
+            tmp_file = f"{self.path}.tmp"
+            try:
+                with gzip.open(tmp_file, "wt", encoding="utf-8") as f:
+                    json.dump(data, f, separators=(",", ":"))
+                os.replace(tmp_file, self.path)
+                self._unsaved = False
+            except Exception as e:
+                logger.error(f"Failed to save HTTP archive: {e}")
+
+    @staticmethod
+    def _request_key(request: httpx.Request) -> str:
+        return f"{request.method} {request.url}"
+
+    def record_response(self, request: httpx.Request, response: httpx.Response):
+        entry = {
+            "status": response.status_code,
+            "headers": {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers},
+            "content": base64.b64encode(response.content).decode("ascii"),
+        }
+        with self._lock:
+            if self.closed:
+                return
+            self._http.setdefault(self._request_key(request), []).append(entry)
+            self._unsaved = True
+
+    def replay_response(self, request: httpx.Request) -> httpx.Response:
+        key = self._request_key(request)
+        with self._lock:
+            responses = self._http.get(key)
+            if not responses:
+                raise httpx.ConnectError(f"Not in HTTP archive: {key}", request=request)
+            position = self._replay_positions.get(key, 0)
+            self._replay_positions[key] = position + 1
+            entry = responses[min(position, len(responses) - 1)]
+        return httpx.Response(
+            entry["status"],
+            headers=entry["headers"],
+            content=base64.b64decode(entry["content"]),
+            request=request,
+        )
+
+    def record_geocode(self, query: str, location):
+        with self._lock:
+            if self.closed:
+                return
+            self._geocode[query] = [location.latitude, location.longitude] if location else None
+            self._unsaved = True
+
+    def replay_geocode(self, query: str) -> Optional[ReplayedLocation]:
+        with self._lock:
+            coords = self._geocode.get(query)
+        return ReplayedLocation(*coords) if coords else None
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    Passes requests to the real transport and writes every response into the archive.
+    """
+
+    def __init__(self, archive: HttpArchive, transport: httpx.AsyncBaseTransport):
+        self.archive = archive
+        self.transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        try:
+            content = await response.aread()
+        finally:
+            await response.aclose()
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+        recorded = httpx.Response(response.status_code, headers=headers, content=content, request=request)
+        self.archive.record_response(request, recorded)
+        return recorded
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Answers every request from the archive.
+    """
+
+    def __init__(self, archive: HttpArchive):
+        self.archive = archive
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return self.archive.replay_response(request)
+
+
+class ArchiveGeocoder:
+    """
+    Wraps a geopy geocoder: records its answers, or replays them without asking it.
+    """
+
+    def __init__(self, archive: HttpArchive, geolocator):
+        self.archive = archive
+        self.geolocator = geolocator
+
+    def geocode(self, query: str, **kwargs):
+        if not self.archive.recording:
+            return self.archive.replay_geocode(query)
+        location = self.geolocator.geocode(query, **kwargs)
+        self.archive.record_geocode(query, location)
+        return location
+
+
+def archive_from_env() -> Optional[HttpArchive]:
+    """
+    Returns the archive selected by HTTP_REPLAY_MODE ("record" or "replay"),
+    HTTP_REPLAY_ARCHIVE and HTTP_REPLAY_RECORD_CYCLES, or None for normal operation.
+    Replaying pins the clock to the recording time, so date-dependent parsing
+    (year inference, "every Wednesday") gives the same events as during recording.
+    """
+    mode = (os.getenv(REPLAY_MODE_ENV) or "").strip().lower()
+    if not mode:
+        return None
+    if mode not in (MODE_RECORD, MODE_REPLAY):
+        logger.error(f"Invalid {REPLAY_MODE_ENV} {mode!r}, expected '{MODE_RECORD}' or '{MODE_REPLAY}'.")
+        return None
+
+    try:
+        record_cycles = max(0, int(os.getenv(REPLAY_RECORD_CYCLES_ENV, DEFAULT_RECORD_CYCLES)))
+    except ValueError:
+        logger.error(f"Invalid {REPLAY_RECORD_CYCLES_ENV}, recording {DEFAULT_RECORD_CYCLES} cycle(s).")
+        record_cycles = DEFAULT_RECORD_CYCLES
+    archive = HttpArchive(os.getenv(REPLAY_ARCHIVE_ENV, DEFAULT_ARCHIVE_FILE), mode, record_cycles)
+    if mode == MODE_REPLAY:
+        clock.pin(archive.recorded_at)
+    logger.info(f"HTTP {mode} mode, archive {archive.path}.")
+    return archive
@@ -0,0 +1,190 @@
+import re
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+from .models import ProviderConfig
+
+logger = logging.getLogger(__name__)
+
+INTERVAL_UNITS = {
+    "s": timedelta(seconds=1),
+    "m": timedelta(minutes=1),
+    "h": timedelta(hours=1),
+    "d": timedelta(days=1),
+    "w": timedelta(weeks=1),
+}
+INTERVAL_PART = re.compile(r"(\d+(?:\.\d+)?)\s*([smhdw])", re.IGNORECASE)
+
+DEFAULT_UPDATE_INTERVAL = "24h"
+# Failed providers are retried after this delay instead of waiting a full interval
+DEFAULT_RETRY_INTERVAL = timedelta(minutes=15)
+
+
+def parse_interval(value: str) -> timedelta:
+    """
+    Parses interval strings like "6h", "30m", "1d" or "1h30m" into a timedelta.
+    Raises ValueError for anything that is not a positive interval.
+    """
+    text = str(value).strip() if value is not None else ""
+    parts = INTERVAL_PART.findall(text)
+    if not parts or INTERVAL_PART.sub("", text).strip():
+        raise ValueError(f"Invalid interval: {value!r}")
+
+    interval = timedelta()
+    for amount, unit in parts:
+        interval += float(amount) * INTERVAL_UNITS[unit.lower()]
+    if interval <= timedelta():
+        raise ValueError(f"Interval must be positive: {value!r}")
+    return interval
+
+
+@dataclass
+class ProviderSchedule:
+    provider_id: str
+    interval: timedelta
+    next_due: datetime
+    interval_spec: tuple = ()
+    last_success: Optional[datetime] = None
+    last_failure: Optional[datetime] = None
+    consecutive_failures: int = 0
+    running: bool = False
+
+
+class ProviderScheduler:
+    """
+    Tracks when each provider was last updated successfully and when it is due next.
+    The set of schedules is re-synced with the provider configs on every tick, so
+    added, removed or re-timed providers in config.yaml take effect without a restart.
+    """
+
+    def __init__(self, retry_interval: timedelta = DEFAULT_RETRY_INTERVAL):
+        self.retry_interval = retry_interval
+        self._schedules: Dict[str, ProviderSchedule] = {}
+        # Last successful updates of earlier runs, applied when a provider's schedule is created
+        self._restored_success: Dict[str, datetime] = {}
+        self._lock = Lock()
+
+    def restore_last_success(self, last_success: Dict[str, datetime]):
+        """
+        Seeds the last successful update of providers (e.g. from the event store), so they
+        are due one interval after it instead of right away.
+        """
+        with self._lock:
+            self._restored_success.update(last_success)
+            for provider_id, schedule in self._schedules.items():
+                restored = self._restored_success.pop(provider_id, None)
+                if restored is not None and schedule.last_success is None and schedule.consecutive_failures == 0:
+                    schedule.last_success = restored
+                    schedule.next_due = restored + schedule.interval
+
+    def resolve_interval(self, config: ProviderConfig, default_interval: str) -> timedelta:
+        try:
+            return parse_interval(config.update_interval or default_interval)
+        except ValueError as e:
+            logger.error(f"Provider {config.id}: {e}, using default interval {default_interval}")
+        try:
+            return parse_interval(default_interval)
+        except ValueError:
+            logger.error(f"Invalid default_update_interval {default_interval!r}, using {DEFAULT_UPDATE_INTERVAL}")
+            return parse_interval(DEFAULT_UPDATE_INTERVAL)
+
+    def sync(self, configs: Iterable[ProviderConfig], default_interval: str = DEFAULT_UPDATE_INTERVAL, now: Optional[datetime] = None):
+        """
+        Aligns the schedules with the enabled providers: new providers are due
+        immediately (or one interval after a restored last success), removed or disabled ones are dropped and changed intervals
+        are applied relative to the last successful update.
+        """
+        now = now or datetime.now()
+        with self._lock:
+            active = set()
+            for config in configs:
+                if not config.enabled:
+                    continue
+                active.add(config.id)
+                schedule = self._schedules.get(config.id)
+                interval_spec = (config.update_interval, default_interval)
+                if schedule is not None and schedule.interval_spec == interval_spec:
+                    continue
+
+                interval = self.resolve_interval(config, default_interval)
+                if schedule is None:
+                    last_success = self._restored_success.pop(config.id, None)
+                    next_due = last_success + interval if last_success is not None else now
+                    self._schedules[config.id] = ProviderSchedule(
+                        config.id, interval, next_due=next_due, interval_spec=interval_spec, last_success=last_success,
+                    )
+                    continue
+
+                schedule.interval_spec = interval_spec
+                if schedule.interval != interval:
+                    logger.info(f"Update interval of {config.id} changed to {interval}.")
+                    schedule.interval = interval
+                    # Providers that never ran (or are waiting for a retry) stay due as they are
+                    if schedule.last_success is not None and schedule.consecutive_failures == 0:
+                        schedule.next_due = schedule.last_success + interval
+
+            for provider_id in set(self._schedules) - active:
+                logger.info(f"Removing schedule of provider {provider_id}.")
+                del self._schedules[provider_id]
+
+    def due_providers(self, configs: Iterable[ProviderConfig], now: Optional[datetime] = None) -> List[ProviderConfig]:
+        now = now or datetime.now()
+        with self._lock:
+            return [
+                config for config in configs
+                if config.id in self._schedules
+                and not self._schedules[config.id].running
+                and self._schedules[config.id].next_due <= now
+            ]
+
+    def claim(self, provider_id: str) -> bool:
+        """
+        Marks a provider as running. Returns False if it is already being updated,
+        so a forced reload never scrapes a provider twice in parallel.
+        """
+        with self._lock:
+            schedule = self._schedules.get(provider_id)
+            if schedule is None:
+                return True
+            if schedule.running:
+                return False
+            schedule.running = True
+            return True
+
+    def mark_success(self, provider_id: str, now: Optional[datetime] = None):
+        now = now or datetime.now()
+        with self._lock:
+            schedule = self._schedules.get(provider_id)
+            if schedule is None:
+                return
+            schedule.running = False
+            schedule.last_success = now
+            schedule.consecutive_failures = 0
+            schedule.next_due = now + schedule.interval
+
+    def mark_failure(self, provider_id: str, now: Optional[datetime] = None):
+        now = now or datetime.now()
+        with self._lock:
+            schedule = self._schedules.get(provider_id)
+            if schedule is None:
+                return
+            schedule.running = False
+            schedule.last_failure = now
+            schedule.consecutive_failures += 1
+            schedule.next_due = now + min(self.retry_interval, schedule.interval)
+
+    def get_status(self) -> Dict[str, dict]:
+        with self._lock:
+            return {
+                provider_id: {
+                    "update_interval": str(schedule.interval),
+                    "last_success": schedule.last_success.isoformat() if schedule.last_success else None,
+                    "next_due": schedule.next_due.isoformat(),
+                    "consecutive_failures": schedule.consecutive_failures,
+                    "running": schedule.running,
+                }
+                for provider_id, schedule in self._schedules.items()
+            }
@@ -0,0 +1,44 @@
+"""
+Runs the provider updates without the API: python -m app.scraper
+
+Takes part in the leader election like the API processes: while it is the leader, it
+publishes the events to the shared store (EVENT_SNAPSHOT_FILE) that the API workers read.
+"""
+import logging
+import signal
+import threading
+
+from .core import ConfigLoader, ProviderLoader, ServiceOrchestrator
+from .leader import LeaderElection
+from .snapshot_store import SnapshotStore
+from .storage import EventStorage
+
+logger = logging.getLogger(__name__)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    storage = EventStorage(SnapshotStore())
+    orchestrator = ServiceOrchestrator(ConfigLoader(), ProviderLoader(), storage)
+
+    def become_leader():
+        storage.restore(orchestrator.get_enabled_provider_ids())
+        orchestrator.start()
+
+    election = LeaderElection(on_elected=become_leader)
+
+    stopped = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stopped.set())
+
+    election.start()
+    if not election.is_leader:
+        logger.info("Another process runs the scraper, waiting to take over.")
+    stopped.wait()
+    orchestrator.shutdown()
+    election.shutdown()
+    logger.info("Scraper stopped.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import math
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .models import EventRecord
+
+TOKEN_PATTERN = re.compile(r"\w+")
+MIN_TOKEN_LENGTH = 2
+TITLE_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+# Score factor of a prefix match ("jaz" -> "jazz") compared to a full token match
+PREFIX_MATCH_FACTOR = 0.5
+
+# Very common German/English words that would match almost every event
+STOPWORDS = frozenset(
+    "der die das den dem des ein eine einer eines einem einen und oder mit im in am an auf "
+    "aus bei fuer von vom zu zum zur ist es sich wir ihr sie the and of to for on at".split()
+)
+
+# Umlauts are written out as in German transliteration, so "Bühne" and "Buehne" are the same token
+_UMLAUTS = {"ä": "ae", "ö": "oe", "ü": "ue"}
+
+
+class _FoldTable(dict):
+    """
+    str.translate() table that drops accents: maps each character to its decomposition
+    without combining marks, computed on first use.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        decomposed = unicodedata.normalize("NFKD", chr(codepoint))
+        folded = self[codepoint] = "".join(char for char in decomposed if not unicodedata.combining(char))
+        return folded
+
+
+_FOLD_TABLE = _FoldTable({ord(umlaut): transliteration for umlaut, transliteration in _UMLAUTS.items()})
+
+
+def fold(text: str) -> str:
+    """
+    Lowercases and folds German special characters: "ß" -> "ss", umlauts to their
+    transliteration ("ä" -> "ae"), other accents are dropped ("é" -> "e").
+    """
+    text = text.casefold()
+    if not text.isascii():
+        # Composed form first, so decomposed umlauts ("u" + combining diaeresis) fold alike
+        text = unicodedata.normalize("NFC", text).translate(_FOLD_TABLE)
+    return text
+
+
+def tokenize(text: str) -> List[str]:
+    return [
+        token for token in TOKEN_PATTERN.findall(fold(text))
+        if len(token) >= MIN_TOKEN_LENGTH and token not in STOPWORDS
+    ]
+
+
+class TextIndex:
+    """
+    Inverted index over the titles and descriptions of one provider's events.
+    Positions refer to the event list the index was built from. Immutable; the postings
+    are built on the first search, so saving (or restoring) events does not pay for
+    tokenizing them.
+    """
+
+    def __init__(self, events: Sequence[EventRecord]):
+        self.events = events
+        self._postings: Optional[Tuple[List[str], Dict[str, Tuple[Tuple[int, float], ...]]]] = None
+        self._lock = threading.Lock()
+
+    def _build(self) -> Tuple[List[str], Dict[str, Tuple[Tuple[int, float], ...]]]:
+        postings: Dict[str, Dict[int, float]] = {}
+        for position, event in enumerate(self.events):
+            for text, weight in ((event.title, TITLE_WEIGHT), (event.description, DESCRIPTION_WEIGHT)):
+                for token in tokenize(text or ""):
+                    event_weights = postings.setdefault(token, {})
+                    event_weights[position] = event_weights.get(position, 0.0) + weight
+
+        vocabulary = sorted(postings)
+        return vocabulary, {token: tuple(event_weights.items()) for token, event_weights in postings.items()}
+
+    @property
+    def postings(self) -> Tuple[List[str], Dict[str, Tuple[Tuple[int, float], ...]]]:
+        """
+        (sorted vocabulary, token -> ((position, weight), ...)).
+        """
+        if self._postings is None:
+            with self._lock:
+                if self._postings is None:
+                    self._postings = self._build()
+        return self._postings
+
+    def match(self, query_token: str) -> Dict[int, float]:
+        """
+        Returns {position: weight} for all events containing a token that equals
+        or starts with query_token. Full matches count more than prefix matches.
+        """
+        vocabulary, postings = self.postings
+        matches: Dict[int, float] = {}
+        start = bisect_left(vocabulary, query_token)
+        for token in vocabulary[start:]:
+            if not token.startswith(query_token):
+                break
+            factor = 1.0 if token == query_token else PREFIX_MATCH_FACTOR
+            for position, weight in postings[token]:
+                score = weight * factor
+                if score > matches.get(position, 0.0):
+                    matches[position] = score
+        return matches
+
+
+EMPTY_TEXT_INDEX = TextIndex(())
+
+
+def search(indexes: Iterable[TextIndex], query: str, total_events: int) -> List[Tuple[float, EventRecord]]:
+    """
+    Ranked prefix search over several provider indexes. Every query token has to match
+    (AND); the score sums title/description weights scaled by how rare each token is.
+    Returns (score, event), best first.
+    """
+    query_tokens = list(dict.fromkeys(tokenize(query)))
+    if not query_tokens:
+        return []
+
+    per_index = []
+    document_frequency = [0] * len(query_tokens)
+    for index in indexes:
+        matches = [index.match(token) for token in query_tokens]
+        for i, token_matches in enumerate(matches):
+            document_frequency[i] += len(token_matches)
+        per_index.append((index, matches))
+
+    idf = [math.log(1 + total_events / frequency) if frequency else 0.0 for frequency in document_frequency]
+    results = []
+    for index, matches in per_index:
+        if not all(matches):
+            continue
+        positions = set(matches[0]).intersection(*matches[1:])
+        for position in positions:
+            score = sum(idf[i] * token_matches[position] for i, token_matches in enumerate(matches))
+            results.append((score, index.events[position]))
+
+    results.sort(key=lambda item: -item[0])
+    return results
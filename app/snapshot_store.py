@@ -0,0 +1,216 @@
+import json
+import logging
+import os
+import sqlite3
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from .models import EventRecord
+
+logger = logging.getLogger(__name__)
+
+# Version of the stored row layout (EventRecord.to_row); rows of other versions are ignored
+ROW_FORMAT = 1
+# Version of the tables; files with another version are recreated (they only hold a cache)
+SCHEMA_VERSION = 2
+# Readers map the file into memory instead of copying pages through read() calls
+MMAP_SIZE = 256 * 1024 * 1024
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS provider_events (
+        provider_id TEXT PRIMARY KEY,
+        generation INTEGER NOT NULL,
+        row_format INTEGER NOT NULL,
+        saved_at REAL NOT NULL,
+        event_count INTEGER NOT NULL,
+        events BLOB NOT NULL
+    )
+    """,
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+)
+
+
+class StoreChanges(NamedTuple):
+    """
+    What changed in the store after a generation: the current generation, the events of
+    every provider saved since then (with the generation of its save), and the ids of all
+    providers in the store (providers missing there were removed).
+    """
+    epoch: str
+    generation: int
+    providers: Dict[str, Tuple[int, List[EventRecord]]]
+    provider_ids: Set[str]
+
+
+class SnapshotStore:
+    """
+    Persists the stored events of each provider in a local SQLite file, so a restarted
+    server answers with the last known events right away instead of waiting for every
+    provider to be fetched again.
+
+    One row per provider holds its events as zlib-compressed JSON rows, so a save only
+    rewrites the provider that changed and loading skips model validation.
+
+    The file can be shared by several processes: one writer (the process running the
+    scraper) and any number of readers (API workers) that poll get_generation() and load
+    only the providers saved since their last sync. In WAL mode readers never block the
+    writer or each other. The store's epoch and generation number every published version,
+    so all processes agree on ETags and sync tokens.
+    """
+
+    def __init__(self, db_file: Optional[str] = None):
+        self.db_file = db_file or os.getenv("EVENT_SNAPSHOT_FILE", "events.db")
+        self.epoch = uuid.uuid4().hex[:8]
+        try:
+            with self._connect() as connection:
+                # WAL: loading (or reading) does not block the writer and vice versa
+                connection.execute("PRAGMA journal_mode=WAL")
+                if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                    connection.execute("DROP TABLE IF EXISTS provider_events")
+                    connection.execute("DROP TABLE IF EXISTS meta")
+                    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+                for statement in SCHEMA:
+                    connection.execute(statement)
+                # The first process to open the file decides the epoch, all others adopt it
+                connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('epoch', ?)", (self.epoch,))
+                connection.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('generation', '0')")
+                self.epoch = self._get_meta(connection, "epoch")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open event snapshot {self.db_file}: {e}")
+
+    @contextmanager
+    def _connect(self):
+        # Short-lived connections: saves come from the update thread, loads from startup
+        # and the reader's sync thread. Commits on success, rolls back on errors, always closes.
+        connection = sqlite3.connect(self.db_file, timeout=10)
+        try:
+            connection.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _get_meta(connection: sqlite3.Connection, key: str) -> Optional[str]:
+        row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row is not None else None
+
+    @staticmethod
+    def _set_meta(connection: sqlite3.Connection, key: str, value: str):
+        connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def get_generation(self) -> int:
+        """
+        Generation of the last published save, cheap enough to poll.
+        """
+        try:
+            with self._connect() as connection:
+                return int(self._get_meta(connection, "generation") or 0)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read event snapshot generation: {e}")
+            return 0
+
+    def get_provider_ids(self) -> Set[str]:
+        try:
+            with self._connect() as connection:
+                return {row[0] for row in connection.execute("SELECT provider_id FROM provider_events")}
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read providers of event snapshot: {e}")
+            return set()
+
+    def get_saved_times(self) -> Dict[str, float]:
+        """
+        Time (epoch seconds) each provider's events were last saved or confirmed unchanged.
+        """
+        try:
+            with self._connect() as connection:
+                return dict(connection.execute("SELECT provider_id, saved_at FROM provider_events"))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read save times of event snapshot: {e}")
+            return {}
+
+    def touch_provider(self, provider_id: str):
+        """
+        Records that the stored events of provider_id are still current. Does not publish
+        a new generation, followers have nothing to load.
+        """
+        try:
+            with self._connect() as connection:
+                connection.execute("UPDATE provider_events SET saved_at = ? WHERE provider_id = ?", (time.time(), provider_id))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to update save time of {provider_id} in snapshot: {e}")
+
+    def save_provider(self, provider_id: str, events: List[EventRecord], generation: int):
+        payload = zlib.compress(json.dumps([event.to_row() for event in events], separators=(",", ":")).encode())
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO provider_events (provider_id, generation, row_format, saved_at, event_count, events) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (provider_id, generation, ROW_FORMAT, time.time(), len(events), payload),
+                )
+                self._set_meta(connection, "generation", str(generation))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to save events of {provider_id} to snapshot: {e}")
+
+    def delete_provider(self, provider_id: str, generation: int):
+        try:
+            with self._connect() as connection:
+                connection.execute("DELETE FROM provider_events WHERE provider_id = ?", (provider_id,))
+                self._set_meta(connection, "generation", str(generation))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to delete events of {provider_id} from snapshot: {e}")
+
+    def load(self, since: int = 0) -> Optional[StoreChanges]:
+        """
+        Returns the events of the providers saved after generation `since` (all of them
+        for 0), read from one consistent version of the store. Unreadable entries are
+        skipped; the next save of that provider replaces them.
+        """
+        try:
+            with self._connect() as connection:
+                # One read transaction, so a concurrent save is either fully seen or not at all
+                connection.execute("BEGIN")
+                epoch = self._get_meta(connection, "epoch") or self.epoch
+                generation = int(self._get_meta(connection, "generation") or 0)
+                provider_ids = {row[0] for row in connection.execute("SELECT provider_id FROM provider_events")}
+                rows = connection.execute(
+                    "SELECT provider_id, generation, events FROM provider_events "
+                    "WHERE generation > ? AND row_format = ? ORDER BY generation",
+                    (since, ROW_FORMAT),
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to load event snapshot {self.db_file}: {e}")
+            return None
+
+        providers = {}
+        for provider_id, saved_generation, payload in rows:
+            try:
+                records = [EventRecord.from_row(row) for row in json.loads(zlib.decompress(payload))]
+            except (zlib.error, ValueError, TypeError) as e:
+                logger.error(f"Skipping unreadable snapshot of {provider_id}: {e}")
+                continue
+            providers[provider_id] = (saved_generation, records)
+        return StoreChanges(epoch, generation, providers, provider_ids)
+
+    def request_refresh(self):
+        """
+        Asks the process running the scraper to update all providers (see take_refresh_request).
+        """
+        try:
+            with self._connect() as connection:
+                self._set_meta(connection, "refresh_requested_at", str(time.time()))
+        except sqlite3.Error as e:
+            logger.error(f"Failed to request refresh: {e}")
+
+    def take_refresh_request(self) -> bool:
+        try:
+            with self._connect() as connection:
+                return connection.execute("DELETE FROM meta WHERE key = 'refresh_requested_at'").rowcount > 0
+        except sqlite3.Error as e:
+            logger.error(f"Failed to read refresh request: {e}")
+            return False
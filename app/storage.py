@@ -1,23 +1,609 @@
-from typing import List, Dict
-from .models import Event
+import logging
+import math
+import threading
+import time
+import uuid
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from heapq import merge
+from typing import Callable, List, Dict, Iterable, NamedTuple, Optional, Tuple
+from .compression import IDENTITY, compress
+from .models import JSON_ADAPTER, Event, EventRecord, wall_seconds
+from .search import TextIndex, EMPTY_TEXT_INDEX, search
+from .snapshot_store import SnapshotStore, StoreChanges
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_KM = 6371.0088
+# Edge length of a spatial grid cell in degrees (about 550 m north-south, 340 m east-west in Berlin)
+GRID_CELL_DEGREES = 0.005
+
+def start_key(event: EventRecord) -> int:
+    """
+    Sort key of the time index: wall-clock seconds of the start date in local time.
+    Aware start dates are converted to local time, so events from providers with and
+    without time zones can be compared.
+    """
+    if event.start_tz is None:
+        return event.start
+    return wall_seconds(event.start_date.astimezone())
+
+def _bound_key(moment: Optional[datetime]) -> Optional[int]:
+    return wall_seconds(moment) if moment is not None else None
+
+class TimeIndex(NamedTuple):
+    """
+    Events sorted by start date, with their sort keys (for bisect) and the provider each
+    entry was saved for (which may differ from event.provider_id).
+    """
+    keys: List[int]
+    owners: List[str]
+    events: List[EventRecord]
+
+    def range(self, start: Optional[datetime], end: Optional[datetime]) -> Tuple[int, int]:
+        low = bisect_left(self.keys, wall_seconds(start)) if start is not None else 0
+        high = bisect_left(self.keys, wall_seconds(end)) if end is not None else len(self.keys)
+        return low, max(low, high)
+
+EMPTY_INDEX = TimeIndex([], [], [])
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+def _cell(lat: float, lon: float) -> Tuple[int, int]:
+    return math.floor(lat / GRID_CELL_DEGREES), math.floor(lon / GRID_CELL_DEGREES)
+
+class GridEntry(NamedTuple):
+    latitude: float
+    longitude: float
+    start: int
+    owner: str
+    event: EventRecord
+
+class SpatialIndex:
+    """
+    Uniform lat/lon grid over all events with coordinates. A radius query only looks at
+    the cells overlapping the search circle's bounding box (or at the occupied cells, if
+    that is fewer), then checks the exact distance of the events found there.
+    Instances are immutable; with_provider() returns an updated copy.
+    """
+
+    def __init__(self, cells: Optional[Dict[Tuple[int, int], Tuple[GridEntry, ...]]] = None):
+        self.cells = cells or {}
+
+    def with_provider(self, provider_id: str, events: Iterable[EventRecord], keys: Iterable[int]) -> "SpatialIndex":
+        added: Dict[Tuple[int, int], List[GridEntry]] = {}
+        for event, key in zip(events, keys):
+            if event.latitude is None or event.longitude is None:
+                continue
+            entry = GridEntry(event.latitude, event.longitude, key, provider_id, event)
+            added.setdefault(_cell(event.latitude, event.longitude), []).append(entry)
+
+        cells = {}
+        for cell in self.cells.keys() | added.keys():
+            entries = tuple(entry for entry in self.cells.get(cell, ()) if entry.owner != provider_id)
+            entries += tuple(added.get(cell, ()))
+            if entries:
+                cells[cell] = entries
+        return SpatialIndex(cells)
+
+    @staticmethod
+    def _bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+        lat_delta = math.degrees(radius_km / EARTH_RADIUS_KM)
+        min_lat, max_lat = max(latitude - lat_delta, -90.0), min(latitude + lat_delta, 90.0)
+        cos_lat = min(math.cos(math.radians(min_lat)), math.cos(math.radians(max_lat)))
+        lon_delta = 180.0 if cos_lat <= 1e-9 else min(180.0, lat_delta / cos_lat)
+        return min_lat, max_lat, longitude - lon_delta, longitude + lon_delta
+
+    def _candidate_cells(self, min_lat: float, max_lat: float, min_lon: float, max_lon: float) -> Iterable[Tuple[GridEntry, ...]]:
+        low_row, low_col = _cell(min_lat, min_lon)
+        high_row, high_col = _cell(max_lat, max_lon)
+        if (high_row - low_row + 1) * (high_col - low_col + 1) > len(self.cells):
+            return self.cells.values()
+        return (
+            self.cells[(row, col)]
+            for row in range(low_row, high_row + 1)
+            for col in range(low_col, high_col + 1)
+            if (row, col) in self.cells
+        )
+
+    def candidate_count(self, latitude: float, longitude: float, radius_km: float) -> int:
+        box = self._bounding_box(latitude, longitude, radius_km)
+        return sum(len(entries) for entries in self._candidate_cells(*box))
+
+    def nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        accept: Optional[Callable[[GridEntry], bool]] = None,
+    ) -> List[Tuple[float, GridEntry]]:
+        """
+        Returns (distance in km, entry) for all entries within the radius that pass
+        `accept`, nearest first.
+        """
+        min_lat, max_lat, min_lon, max_lon = self._bounding_box(latitude, longitude, radius_km)
+        found = []
+        for entries in self._candidate_cells(min_lat, max_lat, min_lon, max_lon):
+            for entry in entries:
+                # Cheap box test first, the exact distance only for what is left
+                if not (min_lat <= entry.latitude <= max_lat and min_lon <= entry.longitude <= max_lon):
+                    continue
+                if accept is not None and not accept(entry):
+                    continue
+                distance = haversine_km(latitude, longitude, entry.latitude, entry.longitude)
+                if distance <= radius_km:
+                    found.append((distance, entry))
+        found.sort(key=lambda item: (item[0], item[1].start))
+        return found
+
+# Number of added/updated/removed events kept for delta sync; older sync tokens need a full resync
+CHANGE_LOG_MAX_EVENTS = 50_000
+
+class ChangeSet(NamedTuple):
+    """
+    Difference between two saves of one provider, by Event.id.
+    """
+    generation: int
+    provider_id: str
+    added: Tuple[EventRecord, ...]
+    updated: Tuple[EventRecord, ...]
+    removed: Tuple[str, ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.added) + len(self.updated) + len(self.removed)
+
+class Changes(NamedTuple):
+    """
+    Net changes between a generation and `generation`. If `complete` is False, the change
+    log does not reach back far enough and the client has to reload all events.
+    """
+    generation: int
+    complete: bool
+    changed: List[EventRecord]
+    removed: List[str]
+
+def unique_events(records: Iterable[EventRecord]) -> List[EventRecord]:
+    """
+    Drops events whose id was already seen (keeping the first), so every stored event
+    can be addressed by its id in the change log and in delta sync.
+    """
+    seen = set()
+    unique = []
+    for record in records:
+        if record.id not in seen:
+            seen.add(record.id)
+            unique.append(record)
+    return unique
+
+def diff_events(previous: Iterable[EventRecord], current: Iterable[EventRecord]) -> Tuple[Tuple[EventRecord, ...], Tuple[EventRecord, ...], Tuple[str, ...]]:
+    """
+    Returns (added, updated, removed ids) between two event lists of one provider.
+    Both lists must hold every id only once (see unique_events).
+    """
+    old = {event.id: event for event in previous}
+    new = {event.id: event for event in current}
+    added = tuple(event for event_id, event in new.items() if event_id not in old)
+    updated = tuple(event for event_id, event in new.items() if event_id in old and old[event_id] != event)
+    removed = tuple(event_id for event_id in old if event_id not in new)
+    return added, updated, removed
+
+class SerializedEvents:
+    """
+    JSON body of an event list (all events or one provider's) and its compressed
+    variants, each built on first request. `generation` is the storage generation
+    the body was built from.
+    """
+
+    def __init__(self, generation: int, body: bytes):
+        self.generation = generation
+        self._variants: Dict[str, bytes] = {IDENTITY: body}
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self._variants[IDENTITY])
+
+    def encoded(self, encoding: str) -> bytes:
+        variant = self._variants.get(encoding)
+        if variant is None:
+            with self._lock:
+                variant = self._variants.get(encoding)
+                if variant is None:
+                    variant = compress(self._variants[IDENTITY], encoding)
+                    self._variants[encoding] = variant
+        return variant
+
+class StorageSnapshot(NamedTuple):
+    """
+    One consistent version of all stored events and their indexes. Snapshots are never
+    modified: a save builds a new one (sharing the unchanged parts) and EventStorage
+    swaps its reference, so readers holding a snapshot need no locks.
+    """
+    # Increased on every save. Serialized bodies and sync tokens refer to it: the full
+    # set to the global generation, a provider's list to the generation of its last save.
+    generation: int
+    provider_generations: Dict[str, int]
+    # Time index per provider and over all providers
+    provider_indexes: Dict[str, TimeIndex]
+    index: TimeIndex
+    spatial_index: SpatialIndex
+    # Full-text index per provider, so saving a provider only replaces its own postings
+    text_indexes: Dict[str, TextIndex]
+    # Per-provider diffs of the recent saves. The log holds every change after generation
+    # change_log_floor; a client that synced before that must reload.
+    change_log: Tuple[ChangeSet, ...]
+    change_log_events: int
+    change_log_floor: int
+
+    def with_provider(self, provider_id: str, records: List[EventRecord], generation: Optional[int] = None) -> "StorageSnapshot":
+        """
+        Returns a snapshot with the events of provider_id replaced, or this one if they are
+        unchanged. Of events sharing an id, only the first is stored. The new snapshot gets
+        the next generation, or `generation` when applying a save published by another process.
+        """
+        previous = self.provider_indexes.get(provider_id)
+        sorted_events = sorted(unique_events(records), key=start_key)
+        if previous is not None and list(previous.events) == sorted_events:
+            # Same events in the same order as stored: keep indexes, cached bodies and ETags
+            return self
+
+        added, updated, removed = diff_events(previous.events if previous else (), sorted_events)
+        keys = [start_key(event) for event in sorted_events]
+
+        # Only the saved provider is sorted; it is merged into the other providers' entries
+        others = (entry for entry in zip(*self.index) if entry[1] != provider_id)
+        saved = ((key, provider_id, event) for key, event in zip(keys, sorted_events))
+        merged = list(merge(others, saved, key=lambda entry: entry[0]))
+
+        if generation is None:
+            generation = self.generation + 1
+        change_set = ChangeSet(generation, provider_id, added, updated, removed)
+        change_log = self.change_log + (change_set,)
+        change_log_events = self.change_log_events + change_set.size
+        change_log_floor = self.change_log_floor
+        while change_log_events > CHANGE_LOG_MAX_EVENTS:
+            dropped, change_log = change_log[0], change_log[1:]
+            change_log_events -= dropped.size
+            change_log_floor = dropped.generation
+
+        return StorageSnapshot(
+            generation=generation,
+            provider_generations={**self.provider_generations, provider_id: generation},
+            provider_indexes={**self.provider_indexes, provider_id: TimeIndex(keys, [provider_id] * len(keys), sorted_events)},
+            index=TimeIndex(
+                [key for key, _, _ in merged],
+                [owner for _, owner, _ in merged],
+                [event for _, _, event in merged],
+            ),
+            spatial_index=self.spatial_index.with_provider(provider_id, sorted_events, keys),
+            text_indexes={**self.text_indexes, provider_id: TextIndex(sorted_events)},
+            change_log=change_log,
+            change_log_events=change_log_events,
+            change_log_floor=change_log_floor,
+        )
+
+    def without_provider(self, provider_id: str, generation: Optional[int] = None) -> "StorageSnapshot":
+        if provider_id not in self.provider_indexes:
+            return self
+        snapshot = self.with_provider(provider_id, [], generation)
+
+        def without(mapping: dict) -> dict:
+            return {key: value for key, value in mapping.items() if key != provider_id}
+
+        return snapshot._replace(
+            provider_generations=without(snapshot.provider_generations),
+            provider_indexes=without(snapshot.provider_indexes),
+            text_indexes=without(snapshot.text_indexes),
+        )
+
+    def get_generation(self, provider_id: Optional[str] = None) -> int:
+        """
+        Generation of the last save that changed get_events(provider_id).
+        """
+        if provider_id is None:
+            return self.generation
+        return self.provider_generations.get(provider_id, 0)
+
+    def get_events(self, provider_id: Optional[str] = None, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[EventRecord]:
+        """
+        Returns stored events sorted by start date, optionally limited to one provider and to
+        start dates in [start, end). Uses binary search on the time index, so the cost
+        depends on the number of matching events only.
+        """
+        index = self.provider_indexes.get(provider_id, EMPTY_INDEX) if provider_id is not None else self.index
+        low, high = index.range(start, end)
+        return index.events[low:high]
+
+    def get_changes(self, since: int) -> Changes:
+        """
+        Returns the events added or updated and the ids of events removed after
+        generation `since`, with later changes of an event replacing earlier ones.
+        """
+        if since < self.change_log_floor or since > self.generation:
+            return Changes(self.generation, False, [], [])
+
+        changed: Dict[str, EventRecord] = {}
+        removed: Dict[str, None] = {}
+        # The log is ordered by generation, so only the change sets after `since` are visited
+        first = bisect_right(self.change_log, since, key=lambda change_set: change_set.generation)
+        for change_set in self.change_log[first:]:
+            for event in change_set.added + change_set.updated:
+                changed[event.id] = event
+                removed.pop(event.id, None)
+            for event_id in change_set.removed:
+                changed.pop(event_id, None)
+                removed[event_id] = None
+        return Changes(self.generation, True, list(changed.values()), list(removed))
+
+    def get_nearby_events(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        provider_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Tuple[EventRecord, float]]:
+        """
+        Returns (event, distance in km) for events within radius_km of the given point,
+        nearest first, optionally limited to one provider and to start dates in [start, end).
+        """
+        if start is not None or end is not None:
+            # Narrow date ranges: checking the distance of the events in the time range is
+            # cheaper than filtering the events of all grid cells around the point by date
+            index = self.provider_indexes.get(provider_id, EMPTY_INDEX) if provider_id is not None else self.index
+            low, high = index.range(start, end)
+            if high - low < self.spatial_index.candidate_count(latitude, longitude, radius_km):
+                found = []
+                for event in index.events[low:high]:
+                    if event.latitude is None or event.longitude is None:
+                        continue
+                    distance = haversine_km(latitude, longitude, event.latitude, event.longitude)
+                    if distance <= radius_km:
+                        found.append((event, distance))
+                # The time range is sorted by start date and sort() is stable
+                found.sort(key=lambda item: item[1])
+                return found
+
+        start_bound, end_bound = _bound_key(start), _bound_key(end)
+
+        def matches(entry: GridEntry) -> bool:
+            return (
+                (provider_id is None or entry.owner == provider_id)
+                and (start_bound is None or entry.start >= start_bound)
+                and (end_bound is None or entry.start < end_bound)
+            )
+
+        # Without filters every entry in range is accepted, so the check is skipped
+        filtered = provider_id is not None or start is not None or end is not None
+        return [
+            (entry.event, distance)
+            for distance, entry in self.spatial_index.nearby(latitude, longitude, radius_km, matches if filtered else None)
+        ]
+
+    def search_events(self, query: str, provider_id: Optional[str] = None, limit: Optional[int] = None) -> List[EventRecord]:
+        """
+        Ranked prefix search over event titles and descriptions ("jaz lesung" finds
+        events matching both words), umlauts and "ß" folded to their transliteration.
+        """
+        if provider_id is not None:
+            indexes = [self.text_indexes.get(provider_id, EMPTY_TEXT_INDEX)]
+        else:
+            indexes = list(self.text_indexes.values())
+        results = search(indexes, query, len(self.index.events))
+        return [event for _, event in results[:limit]]
+
+EMPTY_SNAPSHOT = StorageSnapshot(
+    generation=0,
+    provider_generations={},
+    provider_indexes={},
+    index=EMPTY_INDEX,
+    spatial_index=SpatialIndex(),
+    text_indexes={},
+    change_log=(),
+    change_log_events=0,
+    change_log_floor=0,
+)
 
 class EventStorage:
-    def __init__(self):
-        # Dictionary mapping provider_id to list of events
-        self._events: Dict[str, List[Event]] = {}
+    """
+    Holds the current StorageSnapshot. Saves (from the update thread) build a new snapshot
+    and replace the reference in one assignment; requests read whichever snapshot is
+    current when they start and see it unchanged until they finish. Only writers lock.
+
+    With a SnapshotStore, every changed provider is also written to disk, and restore()
+    loads the last persisted events at startup. Processes that do not run the scraper
+    call sync_from_store() to pick up what the scraping process published.
+    """
+
+    def __init__(self, store: Optional[SnapshotStore] = None):
+        self._snapshot = EMPTY_SNAPSHOT
+        self._write_lock = threading.Lock()
+        self._store = store
+        # Store generation the snapshot is in sync with
+        self._store_generation = 0
+        # Distinguishes generation numbers of different stores or, without a store, of
+        # different server runs (used in ETags and sync tokens)
+        self.epoch = store.epoch if store is not None else uuid.uuid4().hex[:8]
+        self._serialized: Dict[Optional[str], SerializedEvents] = {}
+
+    @property
+    def snapshot(self) -> StorageSnapshot:
+        return self._snapshot
+
+    @property
+    def generation(self) -> int:
+        return self._snapshot.generation
 
     def save_events(self, provider_id: str, events: List[Event]):
-        self._events[provider_id] = events
+        records = [EventRecord.from_event(event) for event in events]
+        with self._write_lock:
+            snapshot = self._snapshot.with_provider(provider_id, records)
+            if snapshot is self._snapshot:
+                self.confirm_provider(provider_id)
+                return
+            self._snapshot = snapshot
+            if self._store is not None:
+                self._store.save_provider(provider_id, snapshot.provider_indexes[provider_id].events, snapshot.generation)
+                self._store_generation = snapshot.generation
 
-    def get_all_events(self) -> List[Event]:
-        all_events = []
-        for provider_events in self._events.values():
-            all_events.extend(provider_events)
-        return all_events
+    def confirm_provider(self, provider_id: str):
+        """
+        Records in the store that an update found the events of provider_id unchanged,
+        so a restarted scraper knows when the provider was last updated.
+        """
+        if self._store is not None:
+            self._store.touch_provider(provider_id)
 
-    def get_events_by_provider(self, provider_id: str) -> List[Event]:
-        return self._events.get(provider_id, [])
+    def get_update_times(self) -> Dict[str, datetime]:
+        """
+        Local time each persisted provider was last updated successfully.
+        """
+        if self._store is None:
+            return {}
+        return {provider_id: datetime.fromtimestamp(saved_at) for provider_id, saved_at in self._store.get_saved_times().items()}
 
     def clear_provider(self, provider_id: str):
-         if provider_id in self._events:
-             del self._events[provider_id]
+        with self._write_lock:
+            snapshot = self._snapshot.without_provider(provider_id)
+            if snapshot is self._snapshot:
+                if self._store is None or provider_id not in self._store.get_provider_ids():
+                    return
+                # Only persisted (skipped by restore): publish the removal as a new generation
+                snapshot = snapshot._replace(generation=snapshot.generation + 1)
+            self._snapshot = snapshot
+            # Bodies of removed providers would never be requested (or rebuilt) again
+            self._serialized.pop(provider_id, None)
+            if self._store is not None:
+                self._store.delete_provider(provider_id, snapshot.generation)
+                self._store_generation = snapshot.generation
+
+    def retain_providers(self, provider_ids: Iterable[str]) -> List[str]:
+        """
+        Removes the events of all providers not in provider_ids, from memory and from the
+        store. Returns the removed provider ids.
+        """
+        stored = self._snapshot.provider_indexes.keys() | (self._store.get_provider_ids() if self._store is not None else set())
+        removed = sorted(stored - set(provider_ids))
+        for provider_id in removed:
+            self.clear_provider(provider_id)
+        return removed
+
+    def restore(self, provider_ids: Optional[Iterable[str]] = None) -> int:
+        """
+        Loads the persisted events into an empty storage, only of provider_ids if given.
+        Returns the number of events.
+        """
+        if self._store is None:
+            return 0
+        started = time.perf_counter()
+        self._apply_store_changes(full=True, provider_ids=set(provider_ids) if provider_ids is not None else None)
+        count = len(self._snapshot.index.events)
+        logger.info(
+            f"Restored {count} events of {len(self._snapshot.provider_indexes)} providers "
+            f"from {self._store.db_file} in {(time.perf_counter() - started) * 1000:.0f} ms."
+        )
+        return count
+
+    def sync_from_store(self) -> bool:
+        """
+        Applies the providers another process saved to the store since the last sync.
+        Only reads the store's generation if nothing was published. Returns True if
+        anything was loaded.
+        """
+        if self._store is None or self._store.get_generation() == self._store_generation:
+            return False
+        return self._apply_store_changes(full=False) is not None
+
+    def _apply_store_changes(self, full: bool, provider_ids: Optional[set] = None) -> Optional[StoreChanges]:
+        changes = self._store.load(0 if full else self._store_generation)
+        if changes is None:
+            return None
+        with self._write_lock:
+            # A different epoch means the store file was recreated: start over
+            full = full or changes.epoch != self.epoch
+            snapshot = EMPTY_SNAPSHOT if full else self._snapshot
+            for provider_id, (generation, records) in changes.providers.items():
+                if provider_ids is not None and provider_id not in provider_ids:
+                    continue
+                snapshot = snapshot.with_provider(provider_id, records, generation)
+            for provider_id in snapshot.provider_indexes.keys() - changes.provider_ids:
+                snapshot = snapshot.without_provider(provider_id, changes.generation)
+                self._serialized.pop(provider_id, None)
+            snapshot = snapshot._replace(generation=max(snapshot.generation, changes.generation))
+            if full:
+                # Loaded events are no changes a client could have missed
+                snapshot = snapshot._replace(change_log=(), change_log_events=0, change_log_floor=snapshot.generation)
+                self._serialized = {}
+            self.epoch = changes.epoch
+            self._store_generation = changes.generation
+            self._snapshot = snapshot
+        return changes
+
+    def request_refresh(self) -> bool:
+        """
+        Asks the scraping process (through the store) to update all providers.
+        Returns False without a store.
+        """
+        if self._store is None:
+            return False
+        self._store.request_refresh()
+        return True
+
+    def take_refresh_request(self) -> bool:
+        return self._store is not None and self._store.take_refresh_request()
+
+    def get_serialized_events(self, provider_id: Optional[str] = None) -> SerializedEvents:
+        """
+        Returns the JSON body of get_events(provider_id), serialized once per change
+        of the underlying events.
+        """
+        snapshot = self._snapshot
+        if provider_id is not None and provider_id not in snapshot.provider_indexes:
+            # Unknown providers are not cached, so arbitrary ids cannot grow the cache
+            return SerializedEvents(snapshot.get_generation(provider_id), b"[]")
+
+        # Bodies are tagged with the generation they were built from; a body of an older
+        # snapshot (also one stored by a slower concurrent request) is simply rebuilt
+        generation = snapshot.get_generation(provider_id)
+        serialized = self._serialized.get(provider_id)
+        if serialized is None or serialized.generation != generation:
+            events = snapshot.get_events(provider_id)
+            serialized = SerializedEvents(generation, JSON_ADAPTER.dump_json([event.to_dict() for event in events]))
+            self._serialized[provider_id] = serialized
+        return serialized
+
+    def get_generation(self, provider_id: Optional[str] = None) -> int:
+        return self._snapshot.get_generation(provider_id)
+
+    def get_events(self, provider_id: Optional[str] = None, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[EventRecord]:
+        return self._snapshot.get_events(provider_id, start, end)
+
+    def get_changes(self, since: int) -> Changes:
+        return self._snapshot.get_changes(since)
+
+    def get_nearby_events(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        provider_id: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Tuple[EventRecord, float]]:
+        return self._snapshot.get_nearby_events(latitude, longitude, radius_km, provider_id, start, end)
+
+    def search_events(self, query: str, provider_id: Optional[str] = None, limit: Optional[int] = None) -> List[EventRecord]:
+        return self._snapshot.search_events(query, provider_id, limit)
+
+    def get_all_events(self) -> List[EventRecord]:
+        return self.get_events()
+
+    def get_events_by_provider(self, provider_id: str) -> List[EventRecord]:
+        return self.get_events(provider_id)
@@ -0,0 +1,192 @@
+"""
+Offline provider benchmark.
+
+Runs providers against the captured pages in the repository, served by an in-process
+httpx transport (no network access), and reports per provider:
+
+- parse time (median of several parse_events() runs) and events per second
+- peak traced Python allocations during one parse
+- peak RSS of the benchmark process (every provider runs in its own process)
+
+Usage (from the repository root):
+    python benchmarks/bench_providers.py                 # run and check against budget.json
+    python benchmarks/bench_providers.py --write-budget  # store current results (+headroom) as budget
+
+Exits with status 1 if a provider exceeds its budget or returns fewer events than expected.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import httpx
+
+from app.core import ProviderLoader
+from app.http_client import AsyncHttpClient
+
+BUDGET_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budget.json")
+
+# Provider module -> captured response served for the provider's URL
+CASES = {
+    "schaubude_berlin_provider.py": "temp_schaubude.html",
+    "park_klinik_weissensee_provider.py": "temp_park_klinik.html",
+    "frei_zeit_haus_provider.py": "temp_frei_zeit_haus.html",
+    "echtzeitmusik_provider.py": "Specification/echtzeitmusik.html",
+}
+
+# Budget = measured value * headroom when written with --write-budget.
+# Timings are noisy, memory is not.
+BUDGET_HEADROOM = {"parse_ms": 2.0, "peak_alloc_kb": 1.25, "peak_rss_mb": 1.25}
+
+
+def fixture_transport(routes: dict) -> httpx.MockTransport:
+    """
+    Serves the captured files for known URLs and 404 for everything else.
+    """
+    contents = {}
+    for url, path in routes.items():
+        with open(os.path.join(ROOT, path), "rb") as f:
+            contents[str(httpx.URL(url))] = f.read()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        content = contents.get(str(request.url))
+        if content is None:
+            return httpx.Response(404)
+        return httpx.Response(200, content=content)
+
+    return httpx.MockTransport(handler)
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(module_name: str, repeat: int) -> dict:
+    provider = ProviderLoader(os.path.join(ROOT, "app", "providers")).load_provider(module_name)
+    if provider is None:
+        raise RuntimeError(f"Could not load {module_name}")
+
+    # Routes follow the provider's own URL, so the benchmark keeps working when it changes
+    routes = {provider.URL: CASES[module_name]}
+
+    async def fetch():
+        async with AsyncHttpClient(transport=fixture_transport(routes)) as client:
+            return await provider.fetch_source(client)
+
+    raw = asyncio.run(fetch())
+
+    # Warm-up run, also the one whose events are counted
+    events = provider.parse_events(raw)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        provider.parse_events(raw)
+        timings.append(time.perf_counter() - start)
+    parse_seconds = statistics.median(timings)
+
+    tracemalloc.start()
+    provider.parse_events(raw)
+    _, peak_alloc = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "events": len(events),
+        "parse_ms": round(parse_seconds * 1000, 2),
+        "events_per_second": round(len(events) / parse_seconds, 1) if parse_seconds else None,
+        "peak_alloc_kb": round(peak_alloc / 1024, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def run_isolated(module_name: str, repeat: int) -> dict:
+    """
+    Runs one case in a fresh interpreter, so peak RSS belongs to that provider alone.
+    """
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--case", module_name, "--repeat", str(repeat)],
+        check=True, capture_output=True, text=True, cwd=ROOT,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def load_budget() -> dict:
+    if not os.path.exists(BUDGET_FILE):
+        return {}
+    with open(BUDGET_FILE, "r") as f:
+        return json.load(f)
+
+
+def check_budget(module_name: str, result: dict, budget: dict) -> list:
+    limits = budget.get(module_name)
+    if not limits:
+        return []
+    failures = []
+    if result["events"] < limits.get("min_events", 0):
+        failures.append(f"events {result['events']} < {limits['min_events']}")
+    for metric in BUDGET_HEADROOM:
+        if metric in limits and result[metric] > limits[metric]:
+            failures.append(f"{metric} {result[metric]} > {limits[metric]}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline provider benchmark")
+    parser.add_argument("providers", nargs="*", help="Provider modules to run (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed parse runs per provider")
+    parser.add_argument("--write-budget", action="store_true", help="Store the results as the new budget")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case, args.repeat)))
+        return
+
+    modules = args.providers or list(CASES)
+    unknown = [m for m in modules if m not in CASES]
+    if unknown:
+        parser.error(f"No fixtures for: {', '.join(unknown)}")
+
+    budget = load_budget()
+    results, failed = {}, False
+    print(f"{'provider':38} {'events':>6} {'parse ms':>9} {'events/s':>9} {'alloc KB':>9} {'RSS MB':>7}")
+    for module_name in modules:
+        try:
+            result = results[module_name] = run_isolated(module_name, args.repeat)
+        except subprocess.CalledProcessError as e:
+            print(f"{module_name:38} FAILED\n{e.stderr}")
+            failed = True
+            continue
+        failures = [] if args.write_budget else check_budget(module_name, result, budget)
+        failed = failed or bool(failures)
+        print(
+            f"{module_name:38} {result['events']:>6} {result['parse_ms']:>9} {result['events_per_second']:>9} "
+            f"{result['peak_alloc_kb']:>9} {result['peak_rss_mb']:>7}"
+            + (f"  OVER BUDGET: {'; '.join(failures)}" if failures else "")
+        )
+
+    if args.write_budget:
+        for module_name, result in results.items():
+            budget[module_name] = {"min_events": result["events"]}
+            budget[module_name].update({m: round(result[m] * headroom, 1) for m, headroom in BUDGET_HEADROOM.items()})
+        with open(BUDGET_FILE, "w") as f:
+            json.dump(budget, f, indent=4)
+            f.write("\n")
+        print(f"Budget written to {BUDGET_FILE}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
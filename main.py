@@ -1,5 +1,13 @@
+import os
+
 import uvicorn
-from app.api import app
+
+# API_WORKERS > 1: the workers share the event store (EVENT_SNAPSHOT_FILE); the one that
+# wins the leader lock (LEADER_LOCK_FILE) runs the scraper, the others only read
+API_WORKERS = int(os.getenv("API_WORKERS", "1"))
 
 if __name__ == "__main__":
-    uvicorn.run("app.api:app", host="0.0.0.0", port=8000, reload=True)
+    if API_WORKERS > 1:
+        uvicorn.run("app.api:app", host="0.0.0.0", port=8000, workers=API_WORKERS)
+    else:
+        uvicorn.run("app.api:app", host="0.0.0.0", port=8000, reload=True)